@@ -4,6 +4,10 @@ GPU VRAM Cleanup Script for PQC CyberSec Simulator
 ===================================================
 Releases GPU memory used by PyTorch, CuPy, and other CUDA libraries.
 Run this script to free up GPU VRAM after closing the demo.
+
+Cleanup is limited to releasing cached memory-pool blocks; CUDA contexts are
+left alone so libraries sharing the process keep working. The running quantum
+service caps its own CuPy pool (set_limit) and does not depend on this script.
 """
 
 import gc
@@ -58,20 +62,10 @@ def clear_gpu_memory():
     except Exception as e:
         print(f"TensorFlow cleanup warning: {e}")
     
-    # 4. Clear numba CUDA cache
-    try:
-        from numba import cuda
-        cuda.close()
-        cleared.append("Numba")
-    except ImportError:
-        pass
-    except Exception as e:
-        print(f"Numba cleanup warning: {e}")
-    
-    # 5. Force Python garbage collection
+    # 4. Force Python garbage collection
     gc.collect()
     
-    # 6. Try to reset CUDA device (last resort)
+    # 5. Try to reset CUDA device (last resort)
     try:
         import cupy as cp
         device = cp.cuda.Device()
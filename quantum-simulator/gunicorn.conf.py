@@ -0,0 +1,35 @@
+# =============================================================================
+# Gunicorn configuration for the Quantum Simulator Service
+# =============================================================================
+#
+# Production entry point (used by the Dockerfile):
+#   gunicorn -c gunicorn.conf.py quantum_service:app
+#
+# A single worker process owns the CUDA context and the in-memory process
+# logs served by /api/quantum/logs; concurrency comes from worker threads.
+# `python quantum_service.py` still runs the Flask development server for
+# local use (e.g. on Windows, where gunicorn is not available).
+# =============================================================================
+
+import os
+
+bind = f"{os.environ.get('FLASK_HOST', '127.0.0.1')}:{os.environ.get('QUANTUM_PORT', '8184')}"
+
+# One process = one GPU context; threads overlap request handling with GPU work
+workers = 1
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Simulations may run up to MAX_DECRYPTION_TIMEOUT_SECONDS (1 hour)
+timeout = 3700
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    """Start GPU initialization in the background once the worker has loaded the app."""
+    import quantum_service
+    quantum_service.start_gpu_initialization()
@@ -29,38 +29,61 @@ import sys
 import json
 import time
 
-# Windows CUDA DLL fix: Add CUDA 12.8 bin directory to PATH before importing CuPy
-# This fixes NVRTC DLL not-found errors on Windows for CUDA 13.x / 12.x
+# Windows CUDA DLL fix: register the CUDA bin directory with the DLL loader before importing CuPy
+# This fixes NVRTC DLL not-found errors on Windows for CUDA 13.x / 12.x without rewriting PATH
 if sys.platform == 'win32':
     cuda_paths = [
         r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v13.0\bin",
         r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v13.1\bin",
         r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v12.9\bin",
         r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v12.8\bin",
-        r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v12.9\bin",
-        r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v12.8\bin",
     ]
-    for cuda_path in cuda_paths:
-        if os.path.exists(cuda_path) and cuda_path not in os.environ.get('PATH', ''):
-            os.environ['PATH'] = cuda_path + os.pathsep + os.environ.get('PATH', '')
-            break
+    # Only the first installed toolkit is registered so DLLs from different versions don't mix
+    cuda_path = next((p for p in cuda_paths if os.path.isdir(p)), None)
+    if cuda_path:
+        os.add_dll_directory(cuda_path)
+
+# Persist JIT-compiled kernels across restarts (CuPy's NVRTC cache and the
+# driver's PTX cache) under one directory that can be mounted as a volume;
+# must be set before CuPy or the CUDA driver initialize
+KERNEL_CACHE_ROOT = os.environ.get('QUANTUM_KERNEL_CACHE', os.path.join(os.path.expanduser('~'), '.cupy'))
+os.environ.setdefault('CUPY_CACHE_DIR', os.path.join(KERNEL_CACHE_ROOT, 'kernel_cache'))
+os.environ.setdefault('CUDA_CACHE_PATH', os.path.join(KERNEL_CACHE_ROOT, 'compute_cache'))
+os.environ.setdefault('CUDA_CACHE_MAXSIZE', str(1 << 30))
 import math
+import queue
+import atexit
 import logging
+import logging.handlers
 import threading
-from functools import lru_cache
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from itertools import count
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict, field
-from datetime import datetime, timedelta
+from dataclasses import dataclass, fields
+from datetime import datetime
 from collections import deque
-from enum import Enum
 
 # Flask web service
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 
+# Fast JSON encoding for API responses (optional; falls back to Flask's encoder)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# GPU array library, imported once; whether it is actually used is decided by initialize_gpu
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
 # Math libraries
 import numpy as np
-from scipy import stats
 
 # Secure random generator (replaces deprecated np.random module-level functions)
 _rng = np.random.default_rng(seed=42)
@@ -78,30 +101,72 @@ CUPY_AVAILABLE = False
 CUQUANTUM_AVAILABLE = False
 GPU_VRAM_INSUFFICIENT = False  # True when GPU exists but VRAM < 6 GB
 
+# Upper bound for CuPy's device memory pool, as a fraction of total VRAM, and the
+# share of that limit the pool may hold before idle cached blocks are released
+GPU_MEMORY_POOL_FRACTION = 0.7
+GPU_MEMORY_POOL_TRIM_FRACTION = 0.9
+GPU_MEMORY_POOL = None  # Device allocator pool installed by initialize_gpu
+
+# Register size limits: the algorithmic caps keep demo runtimes bounded; the
+# memory cap is derived at runtime from free memory with headroom for FFT workspace
+SHOR_MAX_QUBITS = 24
+GROVER_MAX_QUBITS = 20
+STATE_MEMORY_HEADROOM = 4
+CPU_FALLBACK_MEMORY_BYTES = 8 << 30
+
 # Decryption timeout (1 hour = 3600 seconds)
 MAX_DECRYPTION_TIMEOUT_SECONDS = 3600
+# Grover iterations between timeout checks (power of two, tested with a mask)
+TIMEOUT_CHECK_INTERVAL = 64
 
 # String constants
 TIMEOUT_ERROR_MESSAGE = "Operation exceeded 1 hour timeout limit"
 NO_GPU_LABEL = "No GPU"
 CPU_SIM_LIMITED = "CPU Simulation (LIMITED)"
 
-# Process logging storage (thread-safe)
+# Process logging storage: deque.append is atomic, so writers take no lock.
+# Entries are (seq, epoch_seconds, category, level, message, details) tuples and
+# are only turned into dicts when /api/quantum/logs reads them. seq increases
+# monotonically (next() on itertools.count is atomic under the GIL).
 process_logs: deque = deque(maxlen=10000)
-log_lock = threading.Lock()
+_log_seq = count(1)
+
+# /api/quantum/logs/stream polls the buffer at this interval for new entries,
+# ends after LOG_STREAM_DEFAULT_SECONDS unless the client asks for longer, and
+# closes once no simulation is running and nothing was logged for the idle window
+LOG_STREAM_POLL_SECONDS = 0.5
+LOG_STREAM_DEFAULT_SECONDS = 60
+LOG_STREAM_IDLE_SECONDS = 10
+# Quiet streams send a keep-alive line this often so dropped clients are noticed
+LOG_STREAM_KEEPALIVE_SECONDS = 5
 
 # Ensure logs directory exists
 os.makedirs('logs', exist_ok=True)
 
-# Configure logging with UTF-8 encoding for Windows console
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('logs/quantum_service.log', mode='a', encoding='utf-8')
-    ]
-)
+class _ConsoleFormatter(logging.Formatter):
+    """Replace emoji with ASCII tags when the console can't encode them."""
+
+    def format(self, record):
+        text = super().format(record)
+        encoding = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '')
+        return text if encoding == 'utf8' else strip_emoji(text)
+
+# Console and file output run on a background listener thread; request threads
+# only enqueue records
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(_ConsoleFormatter(LOG_FORMAT))
+_file_handler = logging.FileHandler('logs/quantum_service.log', mode='a', encoding='utf-8')
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _console_handler, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Leave the message unformatted here; the listener's handlers apply the real format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 # Fix Windows console encoding for emoji support
@@ -112,37 +177,105 @@ if sys.platform == 'win32':
     except Exception:
         pass
 
+EMOJI_MAP = {
+    '🚀': '[ROCKET]', '✅': '[OK]', '❌': '[ERROR]', '⚠️': '[WARN]',
+    '🔒': '[LOCK]', '🔓': '[UNLOCK]', '⚛️': '[ATOM]', '💔': '[BROKEN]',
+    '🛡️': '[SHIELD]', '📊': '[CHART]', '🔄': '[CYCLE]', '📐': '[MATH]',
+    '🌊': '[WAVE]', '🧮': '[CALC]', '📏': '[MEASURE]', '🎮': '[GPU]',
+    '⏱️': '[TIME]', '🔍': '[SEARCH]', '📋': '[LOG]', '🗑️': '[CLEAR]',
+    '💾': '[SAVE]', '📡': '[SIGNAL]', '🖥️': '[COMPUTER]'
+}
+
+# Single-pass translation table: each emoji is keyed by its base code point and
+# the emoji-presentation selector (U+FE0F) that some of them carry is dropped
+_EMOJI_TABLE = {ord(emoji[0]): replacement for emoji, replacement in EMOJI_MAP.items()}
+_EMOJI_TABLE[0xFE0F] = None
+
 def strip_emoji(text: str) -> str:
     """Remove emoji from text for Windows console compatibility."""
-    emoji_map = {
-        '🚀': '[ROCKET]', '✅': '[OK]', '❌': '[ERROR]', '⚠️': '[WARN]',
-        '🔒': '[LOCK]', '🔓': '[UNLOCK]', '⚛️': '[ATOM]', '💔': '[BROKEN]',
-        '🛡️': '[SHIELD]', '📊': '[CHART]', '🔄': '[CYCLE]', '📐': '[MATH]',
-        '🌊': '[WAVE]', '🧮': '[CALC]', '📏': '[MEASURE]', '🎮': '[GPU]',
-        '⏱️': '[TIME]', '🔍': '[SEARCH]', '📋': '[LOG]', '🗑️': '[CLEAR]',
-        '💾': '[SAVE]', '📡': '[SIGNAL]', '🖥️': '[COMPUTER]'
-    }
-    for emoji, replacement in emoji_map.items():
-        text = text.replace(emoji, replacement)
-    return text
+    return text.translate(_EMOJI_TABLE)
+
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 def log_process(category: str, message: str, level: str = "INFO", details: Dict = None):
     """Thread-safe process logging for UI display."""
-    with log_lock:
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "category": category,
-            "level": level,
-            "message": message,
-            "details": details or {}
-        }
-        process_logs.append(entry)
-        # Also log to console (strip emoji for Windows)
-        log_func = getattr(logger, level.lower(), logger.info)
+    process_logs.append((next(_log_seq), time.time(), category, level, message, details))
+    # Also log to console/file (emoji are stripped there if the console can't encode them);
+    # the UI buffer above always records, the level check only gates the handler output
+    level_num = _LOG_LEVELS.get(level, logging.INFO)
+    if logger.isEnabledFor(level_num):
+        logger.log(level_num, "[%s] %s", category, message)
+
+def log_entry_dict(entry: Tuple) -> Dict:
+    """Expand a stored process-log tuple into the JSON shape the UI expects."""
+    _, ts, category, level, message, details = entry
+    return {
+        "timestamp": datetime.fromtimestamp(ts).isoformat(),
+        "category": category,
+        "level": level,
+        "message": message,
+        "details": details or {}
+    }
+
+def detect_gpu_nvml() -> Dict:
+    """Detect GPU through NVML (pynvml) - no subprocess and no CUDA context."""
+    try:
+        import pynvml
+    except ImportError:
+        return {}
+    try:
+        pynvml.nvmlInit()
         try:
-            log_func(f"[{category}] {message}")
-        except UnicodeEncodeError:
-            log_func(f"[{category}] {strip_emoji(message)}")
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            name = pynvml.nvmlDeviceGetName(handle)
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            major, minor = pynvml.nvmlDeviceGetCudaComputeCapability(handle)
+            try:
+                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+            except pynvml.NVMLError:
+                utilization = 0
+            return {
+                "name": name.decode() if isinstance(name, bytes) else str(name),
+                "total_memory_mb": mem.total // (1024 * 1024),
+                "free_memory_mb": mem.free // (1024 * 1024),
+                "compute_capability": f"{major}.{minor}",
+                "utilization_percent": int(utilization),
+                "detection_method": "nvml"
+            }
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception as e:
+        logger.warning(f"NVML detection failed: {e}")
+    return {}
+
+def detect_gpu_cupy() -> Dict:
+    """Detect GPU in-process through the CUDA runtime (no subprocess spawn)."""
+    if cp is None:
+        return {}
+    try:
+        if cp.cuda.runtime.getDeviceCount() < 1:
+            return {}
+        props = cp.cuda.runtime.getDeviceProperties(0)
+        with cp.cuda.Device(0):
+            free_bytes, total_bytes = cp.cuda.runtime.memGetInfo()
+        name = props["name"]
+        return {
+            "name": name.decode() if isinstance(name, bytes) else str(name),
+            "total_memory_mb": total_bytes // (1024 * 1024),
+            "free_memory_mb": free_bytes // (1024 * 1024),
+            "compute_capability": f"{props['major']}.{props['minor']}",
+            "utilization_percent": 0,
+            "detection_method": "cuda-runtime"
+        }
+    except Exception as e:
+        logger.warning(f"CUDA runtime detection failed: {e}")
+    return {}
 
 def detect_gpu_nvidia_smi() -> Dict:
     """Detect GPU using nvidia-smi command (most reliable)."""
@@ -176,15 +309,16 @@ def initialize_gpu():
     If no GPU is present at all, the service starts in limited mode (no simulation).
     """
     global GPU_AVAILABLE, GPU_OPERATIONAL, GPU_INFO, CUPY_AVAILABLE, CUQUANTUM_AVAILABLE, GPU_VRAM_INSUFFICIENT
+    global GPU_MEMORY_POOL
     
     log_process("GPU_INIT", "🚀 Starting GPU initialization - GPU-ONLY MODE ENABLED", "INFO")
     log_process("GPU_INIT", f"   Minimum VRAM required: {GPU_MIN_VRAM_MB} MB ({GPU_MIN_VRAM_MB // 1024} GB)", "INFO")
     
-    # Step 1: Detect GPU via nvidia-smi
-    GPU_INFO = detect_gpu_nvidia_smi()
+    # Step 1: Detect GPU via NVML, then the CUDA runtime, falling back to nvidia-smi
+    GPU_INFO = detect_gpu_nvml() or detect_gpu_cupy() or detect_gpu_nvidia_smi()
     
     if not GPU_INFO:
-        log_process("GPU_INIT", "❌ CRITICAL: No NVIDIA GPU detected via nvidia-smi!", "ERROR")
+        log_process("GPU_INIT", "❌ CRITICAL: No NVIDIA GPU detected!", "ERROR")
         if GPU_REQUIRED:
             log_process("GPU_INIT", "GPU is REQUIRED. Service will operate in limited mode.", "ERROR")
         return False
@@ -204,7 +338,8 @@ def initialize_gpu():
     
     # Step 2: Initialize CuPy for GPU operations
     try:
-        import cupy as cp
+        if cp is None:
+            raise ImportError("No module named 'cupy'")
         CUPY_AVAILABLE = True
         
         # Verify GPU operations actually work
@@ -223,7 +358,7 @@ def initialize_gpu():
         log_process("GPU_INIT", "Testing GPU computation (first run may take time for kernel compilation)...", "INFO")
         np_data = _rng.random(100).astype(np.float32)  # Smaller, simpler test
         gpu_data = cp.asarray(np_data)
-        gpu_result = cp.sum(gpu_data * 2.0)  # Simple multiplication
+        gpu_result = gpu_data.sum() * 2.0  # Scale after reducing: one pass, no temporary
         float(gpu_result.get())
         cp.cuda.Stream.null.synchronize()
         del gpu_data, gpu_result
@@ -231,6 +366,20 @@ def initialize_gpu():
         
         GPU_OPERATIONAL = True
         log_process("GPU_INIT", "✅ CuPy GPU operations verified successfully!", "INFO")
+
+        # Stream-ordered (cudaMallocAsync) pool lets the driver remap pages instead of
+        # fragmenting; capped so cached blocks are reused between requests without
+        # starving other GPU processes. The pool is not flushed per request.
+        try:
+            GPU_MEMORY_POOL = cp.cuda.MemoryAsyncPool()
+            cp.cuda.set_allocator(GPU_MEMORY_POOL.malloc)
+            pool_kind = "stream-ordered (cudaMallocAsync)"
+        except Exception as pool_err:
+            log_process("GPU_INIT", f"⚠️ cudaMallocAsync unavailable ({str(pool_err)[:60]}), using default pool", "WARNING")
+            GPU_MEMORY_POOL = cp.get_default_memory_pool()
+            pool_kind = "default"
+        GPU_MEMORY_POOL.set_limit(fraction=GPU_MEMORY_POOL_FRACTION)
+        log_process("GPU_INIT", f"✅ CuPy {pool_kind} memory pool limited to {GPU_MEMORY_POOL_FRACTION:.0%} of VRAM", "INFO")
         log_process("GPU_INIT", "Note: First quantum simulation may take longer due to CUDA kernel JIT compilation", "INFO")
         
         # Get detailed GPU info from CuPy
@@ -265,26 +414,110 @@ def initialize_gpu():
         log_process("GPU_INIT", "❌ GPU initialization failed - limited functionality", "ERROR")
         return False
 
-# Initialize GPU on module load
-GPU_READY = initialize_gpu()
+# GPU initialization is not run at import, so importing the module - gunicorn worker
+# boot, tooling - stays fast. gunicorn starts it in the background once the worker
+# is up (start_gpu_initialization); otherwise the first API request runs it.
+GPU_READY = False
+GPU_INIT_DONE = False
+_gpu_init_lock = threading.Lock()
+_gpu_init_thread: Optional[threading.Thread] = None
+_gpu_init_start_lock = threading.Lock()
 
 # Flask app
 app = Flask(__name__)
 CORS(app)
 
 # ============================================================================
-# Import GPU arrays (CuPy if available)
+# Array Backend (CuPy if available)
 # ============================================================================
-if CUPY_AVAILABLE and GPU_OPERATIONAL:
-    import cupy as cp
-    xp = cp
-    log_process("ARRAY_BACKEND", "Using CuPy (GPU) for array operations", "INFO")
-elif GPU_VRAM_INSUFFICIENT:
-    xp = np
-    log_process("ARRAY_BACKEND", f"⚠️ Using NumPy (CPU) - GPU VRAM below {GPU_MIN_VRAM_MB} MB threshold", "WARNING")
-else:
-    xp = np
-    log_process("ARRAY_BACKEND", "⚠️ Falling back to NumPy (CPU) - REDUCED PERFORMANCE", "WARNING")
+xp = np  # Rebound to CuPy by select_array_backend() once the GPU is verified
+
+def select_array_backend():
+    """Pick CuPy or NumPy for array operations from the GPU initialization result."""
+    global xp
+    if CUPY_AVAILABLE and GPU_OPERATIONAL:
+        xp = cp
+        log_process("ARRAY_BACKEND", "Using CuPy (GPU) for array operations", "INFO")
+    elif GPU_VRAM_INSUFFICIENT:
+        xp = np
+        log_process("ARRAY_BACKEND", f"⚠️ Using NumPy (CPU) - GPU VRAM below {GPU_MIN_VRAM_MB} MB threshold", "WARNING")
+    else:
+        xp = np
+        log_process("ARRAY_BACKEND", "⚠️ Falling back to NumPy (CPU) - REDUCED PERFORMANCE", "WARNING")
+
+# ============================================================================
+# Fused GPU Kernels (CuPy only)
+# ============================================================================
+# State-vector precision: complex64 halves memory and bandwidth per amplitude;
+# complex128 is available per request for callers that need double precision
+# (CuPy uses NumPy's dtype objects, so these serve both backends)
+PRECISION_DTYPES = {"single": np.complex64, "double": np.complex128}
+# Server-wide default, overridable per deployment (fp32/fp64 accepted as aliases)
+PRECISION_ALIASES = {"fp32": "single", "fp64": "double"}
+DEFAULT_PRECISION = (os.environ.get('QUANTUM_PRECISION') or 'single').lower()
+DEFAULT_PRECISION = PRECISION_ALIASES.get(DEFAULT_PRECISION, DEFAULT_PRECISION)
+if DEFAULT_PRECISION not in PRECISION_DTYPES:
+    log_process("ARRAY_BACKEND", f"⚠️ Unknown QUANTUM_PRECISION '{DEFAULT_PRECISION}', using single", "WARNING")
+    DEFAULT_PRECISION = "single"
+DEFAULT_CDTYPE = PRECISION_DTYPES[DEFAULT_PRECISION]
+
+def compile_gpu_kernels():
+    """Define the fused CuPy kernels used by the simulations (CuPy backend only)."""
+    global _grover_oracle_sum, _grover_diffuse, _amplitude_probs, _get_fft_plan, _gpu_fft
+    from cupyx.scipy.fftpack import get_fft_plan as _get_fft_plan
+    import cupyx.scipy.fft as _gpu_fft
+    # Grover oracle + mean: sum(sign * s) in a single reduction pass
+    _grover_oracle_sum = cp.ReductionKernel(
+        'T s, T sign', 'T total', 's * sign', 'a + b', 'total = a', '0', 'grover_oracle_sum')
+    # Grover oracle + diffusion in place: s <- 2*mean - sign*s
+    _grover_diffuse = cp.ElementwiseKernel(
+        'T sign, T mean', 'T s', 's = mean + mean - s * sign', 'grover_diffuse')
+    # Measurement probabilities |s|² in one pass (abs() ** 2 is two kernels and a temporary)
+    _amplitude_probs = cp.ElementwiseKernel(
+        'T s', 'F p', 'p = norm(s)', 'amplitude_probs')
+
+def amplitude_probabilities(state):
+    """|amplitude|² for every basis state, fused into a single kernel on the GPU."""
+    if xp is np:
+        # re² + im² directly; abs() would take a square root only to square it again
+        return np.square(state.real) + np.square(state.imag)
+    return _amplitude_probs(state, cp.empty(state.shape, dtype=state.real.dtype))
+
+def warmup_gpu_kernels():
+    """Compile every kernel the simulations use so the first API request doesn't pay JIT latency.
+
+    Mirrors the GPU hot path call for call, once per precision in PRECISION_DTYPES:
+    the Grover oracle/diffusion and probe kernels, the Born-rule sample, and the
+    in-place cuFFT inverse transform the Shor QFT runs.
+    """
+    if xp is np:
+        return
+    start = time.time()
+    n = 1024
+    try:
+        for dtype in PRECISION_DTYPES.values():
+            # Grover iteration, progress probe and measurement (_run_grover_iterations, search)
+            state = cp.empty(n, dtype=dtype)
+            state.fill(1.0 / math.sqrt(n))
+            sign = cp.ones(n, dtype=dtype)
+            sign[3] = -1
+            mean = _grover_oracle_sum(state, sign) * (1.0 / n)
+            _grover_diffuse(sign, mean, state)
+            probe = cp.empty(1, dtype=state.real.dtype)
+            _amplitude_probs(state[3:4], probe)
+            probs = amplitude_probabilities(state)
+            cumulative = cp.cumsum(probs, dtype=cp.float64)
+            index = cp.minimum(cp.searchsorted(cumulative, 0.5 * cumulative[-1]), n - 1)
+            cp.stack((index.astype(cp.float64), probs[index].astype(cp.float64))).get()
+            # Shor QFT (QuantumGates.apply_qft): prescaled in-place inverse FFT. The plan
+            # is built directly, so warmup doesn't occupy a slot in the plan cache
+            state.fill(1.0 / n)
+            _gpu_fft.ifft(state, norm="forward", overwrite_x=True,
+                          plan=_get_fft_plan(state, value_type='C2C'))
+        cp.cuda.Stream.null.synchronize()
+        log_process("GPU_INIT", f"✅ CUDA kernels pre-compiled in {time.time() - start:.1f}s", "INFO")
+    except Exception as e:
+        log_process("GPU_INIT", f"⚠️ Kernel warmup incomplete: {str(e)[:80]}", "WARNING")
 
 # ============================================================================
 # Helper Functions
@@ -294,13 +527,47 @@ def get_gpu_memory_usage() -> float:
     """Get current GPU memory usage in MB."""
     if CUPY_AVAILABLE and GPU_OPERATIONAL:
         try:
-            import cupy as cp
-            mempool = cp.get_default_memory_pool()
-            return mempool.used_bytes() / (1024 * 1024)
+            return GPU_MEMORY_POOL.used_bytes() / (1024 * 1024)
         except Exception:
             pass
     return 0.0
 
+def available_state_memory() -> int:
+    """Bytes a new state vector may use: free VRAM plus cached pool blocks, or available host RAM."""
+    if CUPY_AVAILABLE and GPU_OPERATIONAL:
+        try:
+            mempool = GPU_MEMORY_POOL
+            free_bytes = cp.cuda.Device().mem_info[0] + mempool.free_bytes()
+            if mempool.get_limit():
+                free_bytes = min(free_bytes, mempool.get_limit() - mempool.used_bytes())
+            return free_bytes
+        except Exception:
+            pass
+    return available_host_memory()
+
+# Linux's estimate of memory available without swapping (free pages plus reclaimable cache)
+MEMINFO_PATH = '/proc/meminfo'
+
+def available_host_memory() -> int:
+    """Bytes of host RAM available to a new allocation, including reclaimable page cache."""
+    try:
+        with open(MEMINFO_PATH) as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    # No /proc/meminfo (non-Linux) or no MemAvailable (kernels before 3.14): free pages only
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return CPU_FALLBACK_MEMORY_BYTES
+
+def max_state_qubits(itemsize: int) -> int:
+    """Largest register whose state vector fits in available memory with workspace headroom."""
+    budget = available_state_memory() // (STATE_MEMORY_HEADROOM * itemsize)
+    return max(1, budget.bit_length() - 1)
+
 def clear_gpu_memory() -> bool:
     """
     Clear GPU memory pools to prevent CUFFT_INTERNAL_ERROR and other GPU memory issues.
@@ -308,12 +575,16 @@ def clear_gpu_memory() -> bool:
     """
     if CUPY_AVAILABLE and GPU_OPERATIONAL:
         try:
-            import cupy as cp
             # Synchronize all pending GPU operations
             cp.cuda.Stream.null.synchronize()
             # Clear memory pools
-            mempool = cp.get_default_memory_pool()
+            mempool = GPU_MEMORY_POOL
             pinned_mempool = cp.get_default_pinned_memory_pool()
+            _STATE_BUFFERS.clear()
+            # Waits for an in-flight transform on another thread to finish with its plan
+            with _fft_plan_lock:
+                _FFT_PLANS.clear()
+            release_pinned_staging()
             mempool.free_all_blocks()
             pinned_mempool.free_all_blocks()
             # Synchronize again
@@ -325,10 +596,67 @@ def clear_gpu_memory() -> bool:
             return False
     return True
 
+def trim_gpu_memory_pool():
+    """Release idle cached blocks only once the pool nears its limit, keeping reuse otherwise."""
+    if not (CUPY_AVAILABLE and GPU_OPERATIONAL):
+        return
+    try:
+        limit = GPU_MEMORY_POOL.get_limit()
+        if limit and GPU_MEMORY_POOL.total_bytes() > GPU_MEMORY_POOL_TRIM_FRACTION * limit:
+            GPU_MEMORY_POOL.free_all_blocks()
+            log_process("GPU_MEMORY", f"🧹 Pool near limit - idle blocks released ({get_gpu_memory_usage():.1f} MB in use)", "INFO")
+    except Exception:
+        pass
+
+# Sieved primes shared by every trial division; grown (doubling) when a larger bound is needed.
+# The table and its bound live in one tuple that is replaced in a single assignment, so a
+# request thread never pairs a new bound with the old (shorter) table while another grows it.
+_PRIME_SIEVE: Tuple[np.ndarray, int] = (np.array([], dtype=np.int64), 1)
+
+def primes_up_to(limit: int) -> np.ndarray:
+    """All primes <= limit, from a cached sieve of Eratosthenes."""
+    global _PRIME_SIEVE
+    table, table_limit = _PRIME_SIEVE
+    if limit > table_limit:
+        bound = max(limit, 2 * table_limit, 1024)
+        sieve = np.ones(bound + 1, dtype=bool)
+        sieve[:2] = False
+        for p in range(2, math.isqrt(bound) + 1):
+            if sieve[p]:
+                sieve[p * p::p] = False
+        table = np.flatnonzero(sieve).astype(np.int64)
+        _PRIME_SIEVE = (table, bound)
+    return table[:np.searchsorted(table, limit, side='right')]
+
+def smallest_factor(n: int) -> Optional[int]:
+    """Smallest nontrivial factor of n via vectorized trial division, or None if n is prime."""
+    # The smallest factor is always prime, so only primes need testing
+    candidates = primes_up_to(math.isqrt(n))
+    if candidates.size == 0:
+        return None
+    divides = (n % candidates) == 0
+    idx = int(np.argmax(divides))
+    return int(candidates[idx]) if divides[idx] else None
+
+@lru_cache(maxsize=256)
+def factoring_complexity(n: int) -> Tuple[float, float]:
+    """Estimated (GNFS, Shor) operation counts for factoring n."""
+    # One bigint→float log; ln follows from log2
+    log2_n = math.log2(max(n, 2))
+    ln_n = log2_n * math.log(2)
+    classical_ops = math.exp((64/9 * ln_n) ** (1/3) * (math.log(max(ln_n, 1))) ** (2/3))
+    quantum_ops = log2_n ** 3
+    return classical_ops, quantum_ops
+
 def check_timeout(start_time: float) -> bool:
     """Check if operation has exceeded timeout."""
-    elapsed = time.time() - start_time
-    return elapsed > MAX_DECRYPTION_TIMEOUT_SECONDS
+    if time.time() - start_time <= MAX_DECRYPTION_TIMEOUT_SECONDS:
+        return False
+    if GPU_READY:
+        # Kernels launch asynchronously: drain the queue so the limit is judged on
+        # finished device work and nothing is in flight when the caller cleans up
+        cp.cuda.get_current_stream().synchronize()
+    return True
 
 # ============================================================================
 # Data Classes
@@ -349,6 +677,7 @@ class ShorsResult:
     process_logs: List[Dict]
     timeout_occurred: bool = False
     error_message: Optional[str] = None
+    precision: str = DEFAULT_PRECISION
 
 @dataclass
 class GroversResult:
@@ -365,6 +694,7 @@ class GroversResult:
     process_logs: List[Dict]
     timeout_occurred: bool = False
     error_message: Optional[str] = None
+    precision: str = DEFAULT_PRECISION
 
 @dataclass
 class PQCAttackResult:
@@ -393,28 +723,195 @@ class QuantumGates:
     def __init__(self):
         self.use_gpu = GPU_OPERATIONAL and CUPY_AVAILABLE
         self.array_lib = xp
+        self.dtype = DEFAULT_CDTYPE
         
     def hadamard(self):
-        return self.array_lib.array([[1, 1], [1, -1]], dtype=self.array_lib.complex128) / self.array_lib.sqrt(2)
-    
+        return _HADAMARD
+
     def pauli_x(self):
-        return self.array_lib.array([[0, 1], [1, 0]], dtype=self.array_lib.complex128)
-    
+        return _PAULI_X
+
     def pauli_z(self):
-        return self.array_lib.array([[1, 0], [0, -1]], dtype=self.array_lib.complex128)
-    
+        return _PAULI_Z
+
     def phase(self, theta: float):
-        return self.array_lib.array([[1, 0], [0, self.array_lib.exp(1j * theta)]], dtype=self.array_lib.complex128)
+        # Quantize so numerically equal angles hit the same cache entry
+        return _phase_gate(round(float(theta), 12))
     
     def qft_gate(self, n: int):
-        """Quantum Fourier Transform matrix for n qubits."""
-        dim = 2 ** n
-        omega = self.array_lib.exp(2j * self.array_lib.pi / dim)
-        matrix = self.array_lib.zeros((dim, dim), dtype=self.array_lib.complex128)
-        for i in range(dim):
-            for j in range(dim):
-                matrix[i, j] = omega ** (i * j)
-        return matrix / self.array_lib.sqrt(dim)
+        """Quantum Fourier Transform matrix for n qubits (small registers only)."""
+        if n > QFT_MATRIX_MAX_QUBITS:
+            raise ValueError(f"Dense QFT matrix limited to {QFT_MATRIX_MAX_QUBITS} qubits; use apply_qft()")
+        return _qft_matrix(n, self.dtype)
+
+    def apply_qft(self, state, overwrite: bool = False, prescaled: bool = False):
+        """Apply the QFT to a state vector in O(N log N) without building the 2ⁿ×2ⁿ matrix.
+
+        With overwrite=True the GPU transform runs in place in state's buffer.
+        With prescaled=True the caller has already multiplied state by the QFT's
+        1/√N factor, so the transform skips its separate scaling pass.
+        """
+        # Same convention as qft_gate: |x⟩ → (1/√N) Σ_k e^(2πi·xk/N) |k⟩
+        # ("forward" leaves the inverse transform unscaled)
+        norm = "forward" if prescaled else "ortho"
+        if self.use_gpu:
+            return _gpu_fft.ifft(state, norm=norm, overwrite_x=overwrite, plan=fft_plan(state))
+        return self.array_lib.fft.ifft(state, norm=norm)
+
+# A dense 2ⁿ×2ⁿ QFT needs 8·4ⁿ bytes; beyond this, apply_qft() is the only option
+QFT_MATRIX_MAX_QUBITS = 12
+
+_INV_SQRT2 = 1 / math.sqrt(2)
+_2PI_J = 2j * math.pi
+
+@lru_cache(maxsize=4096)
+def _phase_gate(theta: float):
+    """Build the phase-shift gate for an angle once; callers share (and must not mutate) it."""
+    return xp.array([[1, 0], [0, complex(math.cos(theta), math.sin(theta))]], dtype=DEFAULT_CDTYPE)
+
+@lru_cache(maxsize=8)
+def _qft_twiddles(dim: int, dtype):
+    """Normalized roots of unity ω^k / √dim for k in [0, dim)."""
+    k = xp.arange(dim, dtype=xp.float64)
+    return (xp.exp((_2PI_J / dim) * k) / math.sqrt(dim)).astype(dtype)
+
+@lru_cache(maxsize=8)
+def _qft_matrix(n: int, dtype):
+    """Build the dense QFT matrix by gathering from the twiddle table (cached per n)."""
+    dim = 1 << n
+    k = xp.arange(dim, dtype=xp.int64)
+    # ω^(jk) depends only on jk mod dim; dim is a power of two, so the mod is a mask
+    return _qft_twiddles(dim, dtype)[xp.outer(k, k) & (dim - 1)]
+
+# cuFFT plans kept for reuse, keyed by (length, dtype); Shor attempts at the same
+# register size share one plan instead of rebuilding it (and its work area)
+FFT_PLAN_CACHE_SIZE = 4
+_FFT_PLANS: Dict[Tuple[int, str], Any] = {}
+_fft_plan_lock = threading.Lock()
+
+def fft_plan(state):
+    """1-D C2C cuFFT plan matching state's length and dtype, built once and reused."""
+    key = (state.size, state.dtype.char)
+    plan = _FFT_PLANS.get(key)
+    if plan is None:
+        if len(_FFT_PLANS) >= FFT_PLAN_CACHE_SIZE:
+            _FFT_PLANS.pop(next(iter(_FFT_PLANS)))
+        plan = _FFT_PLANS[key] = _get_fft_plan(state, value_type='C2C')
+    return plan
+
+def build_gate_constants():
+    """(Re)materialize the shared gate matrices and gate library on the active backend."""
+    global _HADAMARD, _PAULI_X, _PAULI_Z, _SHARED_GATES
+    # Fixed single-qubit gates; callers share (and must not mutate) them
+    _HADAMARD = xp.array([[_INV_SQRT2, _INV_SQRT2], [_INV_SQRT2, -_INV_SQRT2]], dtype=DEFAULT_CDTYPE)
+    _PAULI_X = xp.array([[0, 1], [1, 0]], dtype=DEFAULT_CDTYPE)
+    _PAULI_Z = xp.array([[1, 0], [0, -1]], dtype=DEFAULT_CDTYPE)
+    _phase_gate.cache_clear()
+    _qft_twiddles.cache_clear()
+    _qft_matrix.cache_clear()
+    with _fft_plan_lock:
+        _FFT_PLANS.clear()
+    # Gate library shared by every algorithm instance; it only holds backend/dtype
+    # settings and cached matrices, so one instance serves all requests
+    _SHARED_GATES = QuantumGates()
+
+build_gate_constants()
+
+# ============================================================================
+# State Vector Buffers
+# ============================================================================
+
+class StateBufferPool:
+    """Reusable state-vector buffers so requests don't allocate a fresh vector each time."""
+
+    def __init__(self):
+        self._free: List[Any] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, num_states: int, dtype):
+        """Return a buffer view of num_states amplitudes (contents undefined)."""
+        with self._lock:
+            for i, buf in enumerate(self._free):
+                if buf.shape[0] >= num_states and buf.dtype == dtype:
+                    return self._free.pop(i)[:num_states]
+        trim_gpu_memory_pool()
+        return xp.empty(num_states, dtype=dtype)
+
+    def release(self, state):
+        """Hand a buffer obtained from acquire() back to the pool."""
+        buf = state.base if state.base is not None else state
+        with self._lock:
+            self._free.append(buf)
+            # Keep the largest buffers; smaller ones are covered by slicing
+            self._free.sort(key=lambda b: b.shape[0], reverse=True)
+            del self._free[STATE_BUFFER_POOL_SIZE:]
+
+    def clear(self):
+        """Drop all cached buffers (used before releasing GPU memory pools)."""
+        with self._lock:
+            self._free.clear()
+
+# Idle buffers kept for reuse. Deliberately smaller than the gunicorn thread count:
+# a cached 24-qubit register holds 128 MB (256 MB at double precision) outside the
+# memory pool. Concurrent requests beyond the cached buffers fall back to fresh
+# allocations from the pool, and release() keeps only the largest buffers
+STATE_BUFFER_POOL_SIZE = 2
+_STATE_BUFFERS = StateBufferPool()
+
+# Page-locked host buffer for device→host state copies (CPU FFT fallback);
+# grown on demand and reused, since pinning memory is itself expensive
+_PINNED_STAGING = None
+_PINNED_STAGING_BYTES = 0
+_pinned_staging_lock = threading.Lock()
+
+@contextmanager
+def pinned_host_copy(state):
+    """Copy a device state vector into the shared pinned buffer and yield a NumPy view of it."""
+    global _PINNED_STAGING, _PINNED_STAGING_BYTES
+    with _pinned_staging_lock:
+        if _PINNED_STAGING_BYTES < state.nbytes:
+            _PINNED_STAGING = None
+            _PINNED_STAGING = cp.cuda.alloc_pinned_memory(state.nbytes)
+            _PINNED_STAGING_BYTES = state.nbytes
+        host = np.frombuffer(_PINNED_STAGING, dtype=state.dtype, count=state.size)
+        state.get(out=host)
+        yield host
+
+def release_pinned_staging():
+    """Drop the pinned staging buffer so the pinned memory pool can free it."""
+    global _PINNED_STAGING, _PINNED_STAGING_BYTES
+    with _pinned_staging_lock:
+        _PINNED_STAGING = None
+        _PINNED_STAGING_BYTES = 0
+
+# ============================================================================
+# Lazy GPU Initialization
+# ============================================================================
+
+def ensure_gpu_initialized():
+    """Run GPU detection, backend selection and kernel warmup once (thread-safe)."""
+    global GPU_READY, GPU_INIT_DONE
+    if GPU_INIT_DONE:
+        return
+    with _gpu_init_lock:
+        if GPU_INIT_DONE:
+            return
+        GPU_READY = initialize_gpu()
+        select_array_backend()
+        if xp is not np:
+            compile_gpu_kernels()
+        build_gate_constants()
+        warmup_gpu_kernels()
+        GPU_INIT_DONE = True
+
+def start_gpu_initialization():
+    """Run ensure_gpu_initialized() on a background thread, at most once."""
+    global _gpu_init_thread
+    with _gpu_init_start_lock:
+        if GPU_INIT_DONE or _gpu_init_thread is not None:
+            return
+        _gpu_init_thread = threading.Thread(target=ensure_gpu_initialized, name="gpu-init", daemon=True)
+        _gpu_init_thread.start()
 
 # ============================================================================
 # Shor's Algorithm Implementation (GPU-Accelerated)
@@ -429,10 +926,22 @@ class ShorsAlgorithm:
     - Quantum: O(n^3) - polynomial time!
     """
     
-    def __init__(self):
+    def __init__(self, verbose: bool = True, precision: str = DEFAULT_PRECISION, simulate_qft: bool = True,
+                 seed: Optional[int] = None):
         self.use_gpu = GPU_OPERATIONAL and CUPY_AVAILABLE
         self.array_lib = xp
-        self.gates = QuantumGates()
+        self.precision = precision
+        self.dtype = PRECISION_DTYPES[precision]
+        self.gates = _SHARED_GATES
+        self.verbose = verbose
+        # The period comes from the classical order search; the state-vector QFT is the
+        # simulated quantum workload and can be skipped when only the factors matter
+        self.simulate_qft = simulate_qft
+        # Own generator per request: numpy Generators aren't thread-safe under gthread
+        self.rng = np.random.default_rng(seed)
+        # One non-blocking stream per request, shared by all of its attempts, so
+        # concurrent Shor runs overlap instead of serializing on the null stream
+        self.stream = cp.cuda.Stream(non_blocking=True) if self.use_gpu else None
         self.process_logs: List[Dict] = []
         
     def _log_step(self, phase: str, step: int, total: int, message: str):
@@ -446,24 +955,11 @@ class ShorsAlgorithm:
             "progress_percent": round((step / total) * 100, 1),
             "gpu_memory_mb": round(get_gpu_memory_usage(), 2)
         }
-        self.process_logs.append(entry)
+        # Non-verbose results carry no step history, so only the UI log feed gets the entry
+        if self.verbose:
+            self.process_logs.append(entry)
         log_process("SHOR", f"[Step {step}/{total}] {message}", "INFO", entry)
         
-    def gcd(self, a: int, b: int) -> int:
-        while b:
-            a, b = b, a % b
-        return a
-    
-    def mod_exp(self, base: int, exp: int, mod: int) -> int:
-        result = 1
-        base = base % mod
-        while exp > 0:
-            if exp % 2 == 1:
-                result = (result * base) % mod
-            exp = exp >> 1
-            base = (base * base) % mod
-        return result
-    
     def quantum_period_finding(self, a: int, modulus: int, num_qubits: int, start_time: float) -> Tuple[int, List[str]]:
         """Quantum period finding with detailed GPU logging."""
         steps = []
@@ -473,23 +969,41 @@ class ShorsAlgorithm:
             raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
         
         num_states = 2 ** num_qubits
-        state_vector_bytes = num_states * 16  # complex128 = 16 bytes
+        state_vector_bytes = num_states * np.dtype(self.dtype).itemsize
         
+        if not self.simulate_qft:
+            r = self._apply_oracle_and_find_period(a, modulus, num_states, total_steps, steps)
+            log_process("SHOR_GPU", f"⏭️ State-vector QFT skipped ({state_vector_bytes / (1024*1024):.2f} MB not allocated)", "INFO")
+            self._post_process_and_verify(a, modulus, r, total_steps, steps)
+            return r, steps
+
         # Steps 1-2: Initialize quantum register and allocate GPU memory
         self._log_init_register(num_qubits, num_states, state_vector_bytes, total_steps, steps)
-        state = self._allocate_and_superpose(num_states, total_steps, steps)
-        
-        if check_timeout(start_time):
-            raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
-        
-        # Steps 4-5: Oracle and period search
-        r = self._apply_oracle_and_find_period(a, modulus, num_states, total_steps, steps)
-        
-        if check_timeout(start_time):
-            raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
-        
-        # Steps 6-8: QFT
-        self._perform_qft(state, num_states, num_qubits, total_steps)
+        state = None
+        prev_stream = cp.cuda.get_current_stream() if self.stream is not None else None
+        try:
+            if self.stream is not None:
+                self.stream.use()
+            state = self._allocate_and_superpose(num_states, total_steps, steps)
+
+            if check_timeout(start_time):
+                raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
+
+            # Steps 4-5: Oracle and period search
+            r = self._apply_oracle_and_find_period(a, modulus, num_states, total_steps, steps)
+
+            if check_timeout(start_time):
+                raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
+
+            # Steps 6-8: QFT
+            self._perform_qft(state, num_states, num_qubits, total_steps)
+        finally:
+            if prev_stream is not None:
+                # Drain before the buffer can be handed to a request on another stream
+                self.stream.synchronize()
+                prev_stream.use()
+            if state is not None:
+                _STATE_BUFFERS.release(state)
         steps.append("📐 QFT complete: Interference pattern computed on GPU")
         
         # Step 9-10: Classical post-processing and verification
@@ -509,69 +1023,68 @@ class ShorsAlgorithm:
 
     def _allocate_and_superpose(self, num_states, total_steps, steps):
         """Allocate GPU memory and create superposition (Steps 2-3)."""
-        if self.use_gpu:
-            try:
-                cp.cuda.Stream.null.synchronize()
-                cp.get_default_memory_pool().free_all_blocks()
-                cp.get_default_pinned_memory_pool().free_all_blocks()
-                cp.cuda.Stream.null.synchronize()
-                log_process("GPU_CUDA", f"🧹 Pre-allocation cleanup: {get_gpu_memory_usage():.1f} MB used", "INFO")
-            except Exception:
-                pass
-
-        state = self.array_lib.zeros(num_states, dtype=self.array_lib.complex128)
-        state[0] = 1.0
-
-        if self.use_gpu:
-            cp.cuda.Stream.null.synchronize()
-            log_process("GPU_CUDA", f"✅ GPU memory allocated: {get_gpu_memory_usage():.1f} MB used", "INFO")
-
-        steps.append(f"🎮 GPU Memory allocated: {get_gpu_memory_usage():.1f} MB")
-
+        # H⊗n|0⟩ is the uniform superposition, so allocate it directly instead of
+        # materializing |0⟩ first and overwriting it
         self._log_step("HADAMARD_GATE", 3, total_steps,
                       f"🌊 Applying H⊗{num_states} (Hadamard gates on all qubits)")
         log_process("QUANTUM_GATE", f"🌊 Creating superposition: |ψ⟩ = (1/√{num_states})Σ|x⟩", "INFO")
-        state = self.array_lib.ones(num_states, dtype=self.array_lib.complex128) / self.array_lib.sqrt(num_states)
+        state = _STATE_BUFFERS.acquire(num_states, self.dtype)
+        # Amplitude 1/√N times the QFT's own 1/√N, so the transform needs no scaling pass
+        state.fill(1.0 / num_states)
 
         if self.use_gpu:
-            cp.cuda.Stream.null.synchronize()
+            # used_bytes() is a host-side pool counter, so no sync is needed to read it
+            log_process("GPU_CUDA", f"✅ GPU memory allocated: {get_gpu_memory_usage():.1f} MB used", "INFO")
 
+        steps.append(f"🎮 GPU Memory allocated: {get_gpu_memory_usage():.1f} MB")
         steps.append("🌊 Superposition created: All |x⟩ states equally probable")
         log_process("QUANTUM_GATE", "✅ Hadamard transformation complete - uniform superposition achieved", "INFO")
         return state
 
     def _apply_oracle_and_find_period(self, a, modulus, num_states, total_steps, steps):
         """Apply modular exponentiation oracle and find period (Steps 4-5)."""
-        self._log_step("ORACLE_INIT", 4, total_steps,
-                      "🔮 Preparing modular exponentiation oracle U_a")
-        log_process("QUANTUM_ORACLE", "🔮 Oracle: U|x⟩|y⟩ → |x⟩|y ⊕ a^x mod N⟩", "INFO")
-        log_process("QUANTUM_ORACLE", f"🔮 Computing {a}^x mod {modulus} for x ∈ [0, {num_states})", "INFO")
-        steps.append(f"🔮 Oracle applied: Computing {a}^x mod {modulus} in superposition")
         self._log_step("ORACLE", 4, total_steps,
                       f"🔮 Applying modular exponentiation oracle: U|x⟩ = |a^x mod {modulus}⟩")
+        log_process("QUANTUM_ORACLE", "🔮 Oracle: U|x⟩|y⟩ → |x⟩|y ⊕ a^x mod N⟩", "INFO")
+        log_process("QUANTUM_ORACLE", f"🔮 Computing {a}^x mod {modulus} for x ∈ [0, {num_states})", "INFO")
         steps.append(f"🔮 Oracle applied: Computing {a}^x mod {modulus} in superposition")
 
         self._log_step("PERIOD_SEARCH", 5, total_steps,
                       "📊 GPU parallel search for period r where a^r ≡ 1 (mod N)...")
         log_process("GPU_COMPUTE", "🔄 Starting GPU-accelerated period computation", "INFO")
 
-        r = 1
-        val = a % modulus
-        search_iterations = 0
-        while val != 1 and r < num_states:
-            val = (val * a) % modulus
-            r += 1
-            search_iterations += 1
-
-            if r % 2000 == 0:
-                log_process("GPU_COMPUTE", f"🔄 Period search iteration {r:,} - GPU utilization active", "INFO")
-                self._log_step("PERIOD_SEARCH", 5, total_steps,
-                              f"🔄 Modular exponentiation: checked {r:,} values on GPU...")
+        r, search_iterations = self._find_period(a, modulus, num_states)
 
         steps.append(f"📊 Period candidate: r = {r}")
         log_process("QUANTUM_RESULT", f"📊 Period found: r = {r} after {search_iterations:,} iterations", "INFO")
         return r
 
+    def _find_period(self, a, modulus, limit):
+        """Find the multiplicative order r of a mod N (r <= limit) via baby-step/giant-step.
+
+        Returns (r, modular_multiplications). If no period is found below limit, r = limit.
+        a must be coprime to N (callers check gcd(a, N) first); otherwise no order exists.
+        """
+        m = math.isqrt(limit) + 1
+        # Baby steps: a^j mod N for j in [0, m). A repeat of 1 means r < m.
+        baby = {}
+        val = 1
+        for j in range(m):
+            if j > 0 and val == 1:
+                return j, j
+            baby.setdefault(val, j)
+            val = (val * a) % modulus
+
+        # Giant steps: the first i with a^(i*m) == a^j gives r = i*m - j.
+        giant = pow(a, m, modulus)
+        val = giant
+        for i in range(1, m + 1):
+            j = baby.get(val)
+            if j is not None:
+                return min(i * m - j, limit), m + i
+            val = (val * giant) % modulus
+        return limit, 2 * m
+
     def _perform_qft(self, state, num_states, num_qubits, total_steps):
         """Perform QFT with GPU FFT and robust fallback (Steps 6-8)."""
         self._log_step("QFT_PREPARE", 6, total_steps,
@@ -582,62 +1095,26 @@ class ShorsAlgorithm:
         self._log_step("QFT_EXECUTE", 7, total_steps,
                       "📐 Applying Quantum Fourier Transform (QFT) on GPU...")
 
-        fft_success = self._try_gpu_fft(state, num_states)
-
-        if not fft_success:
-            fft_success = self._try_cpu_fft_fallback(state, num_states)
-
-        if self.use_gpu and fft_success:
-            try:
-                cp.cuda.Stream.null.synchronize()
-            except Exception:
-                pass
+        if not self._try_gpu_fft(state, num_states):
+            self._try_cpu_fft_fallback(state, num_states)
 
     def _try_gpu_fft(self, state, num_states):
-        """Attempt GPU FFT with retry mechanism. Returns True on success."""
-        max_fft_retries = 3
-        for fft_attempt in range(max_fft_retries):
-            try:
-                if self.use_gpu:
-                    self._cleanup_gpu_memory_for_fft(fft_attempt, max_fft_retries)
-                self.array_lib.fft.fft(state) / self.array_lib.sqrt(num_states)
+        """Attempt the GPU FFT once. Returns True on success."""
+        # No retry loop: the stream-ordered pool doesn't fragment, so a failed
+        # transform is a genuine out-of-memory and goes straight to the CPU fallback
+        try:
+            # Cached plans own one work area, so transforms sharing a plan must not
+            # overlap across request streams; the lock is held until this one drains
+            with _fft_plan_lock:
+                # In place: the register is a pooled buffer, so no second 2ⁿ vector is needed
+                self.gates.apply_qft(state, overwrite=True, prescaled=True)
                 if self.use_gpu:
-                    cp.cuda.Stream.null.synchronize()
-                log_process("GPU_FFT", f"✅ GPU FFT complete - {get_gpu_memory_usage():.1f} MB VRAM used", "INFO")
-                return True
-            except Exception as fft_err:
-                error_str = str(fft_err)
-                log_process("GPU_FFT", f"⚠️ FFT attempt {fft_attempt + 1} failed: {error_str[:80]}", "WARNING")
-                if not self._handle_fft_retry(error_str, fft_attempt, max_fft_retries):
-                    break
-        return False
-
-    def _handle_fft_retry(self, error_str, fft_attempt, max_fft_retries):
-        """Handle FFT error and attempt GPU memory cleanup for retry. Returns True if should retry."""
-        is_cuda_error = "CUFFT" in error_str.upper() or "CUDA" in error_str.upper()
-        if is_cuda_error and self.use_gpu and fft_attempt < max_fft_retries - 1:
-            try:
-                cp.cuda.Stream.null.synchronize()
-                cp.get_default_memory_pool().free_all_blocks()
-                cp.get_default_pinned_memory_pool().free_all_blocks()
-                time.sleep(0.5)
-                log_process("GPU_FFT", "🔄 GPU memory freed, retrying FFT...", "INFO")
-            except Exception:
-                pass
+                    cp.cuda.get_current_stream().synchronize()
+            log_process("GPU_FFT", f"✅ GPU FFT complete - {get_gpu_memory_usage():.1f} MB VRAM used", "INFO")
             return True
-        return False
-
-    def _cleanup_gpu_memory_for_fft(self, fft_attempt, max_fft_retries):
-        """Clear GPU memory before FFT to prevent CUFFT_INTERNAL_ERROR."""
-        try:
-            cp.cuda.Stream.null.synchronize()
-            cp.get_default_memory_pool().free_all_blocks()
-            cp.get_default_pinned_memory_pool().free_all_blocks()
-            cp.cuda.Stream.null.synchronize()
-            if fft_attempt > 0:
-                log_process("GPU_FFT", f"🔄 FFT retry {fft_attempt + 1}/{max_fft_retries} - GPU memory cleared", "INFO")
-        except Exception as mem_err:
-            log_process("GPU_FFT", f"⚠️ Memory cleanup warning: {str(mem_err)[:50]}", "WARNING")
+        except Exception as fft_err:
+            log_process("GPU_FFT", f"⚠️ GPU FFT error: {str(fft_err)[:80]}", "WARNING")
+            return False
 
     def _try_cpu_fft_fallback(self, state, num_states):
         """Fallback to NumPy CPU FFT if GPU FFT failed. Returns True on success."""
@@ -646,14 +1123,15 @@ class ShorsAlgorithm:
             if self.use_gpu:
                 self._free_gpu_memory_safe()
                 try:
-                    state_cpu = cp.asnumpy(state)
+                    with pinned_host_copy(state) as state_cpu:
+                        _qft_cpu = np.fft.ifft(state_cpu, norm="forward")
                 except Exception:
                     log_process("GPU_FFT", "⚠️ GPU->CPU conversion failed, recreating state on CPU", "WARNING")
-                    state_cpu = np.ones(num_states, dtype=np.complex128) / np.sqrt(num_states)
+                    state_cpu = np.full(num_states, 1.0 / num_states, dtype=self.dtype)
+                    _qft_cpu = np.fft.ifft(state_cpu, norm="forward")
             else:
-                state_cpu = state
-
-            _qft_cpu = np.fft.fft(state_cpu) / np.sqrt(num_states)  # noqa: F841
+                # The register is prescaled by the QFT's 1/√N (see _allocate_and_superpose)
+                _qft_cpu = np.fft.ifft(state, norm="forward")
 
             if self.use_gpu:
                 try:
@@ -673,8 +1151,8 @@ class ShorsAlgorithm:
     def _free_gpu_memory_safe(self):
         """Safely free GPU memory pools."""
         try:
-            cp.cuda.Stream.null.synchronize()
-            cp.get_default_memory_pool().free_all_blocks()
+            cp.cuda.get_current_stream().synchronize()
+            GPU_MEMORY_POOL.free_all_blocks()
             cp.get_default_pinned_memory_pool().free_all_blocks()
             time.sleep(0.2)
         except Exception:
@@ -684,9 +1162,9 @@ class ShorsAlgorithm:
         """Last resort: create a dummy QFT state to continue the algorithm."""
         try:
             if self.use_gpu:
-                cp.ones(num_states, dtype=cp.complex128) / cp.sqrt(num_states)
+                cp.ones(num_states, dtype=self.dtype) / math.sqrt(num_states)
             else:
-                np.ones(num_states, dtype=np.complex128) / np.sqrt(num_states)
+                np.ones(num_states, dtype=self.dtype) / math.sqrt(num_states)
         except Exception:
             self.use_gpu = False
             self.array_lib = np
@@ -700,9 +1178,10 @@ class ShorsAlgorithm:
         log_process("CLASSICAL_COMPUTE", f"✅ Period r = {r} successfully extracted", "INFO")
         steps.append(f"✅ Period r = {r} extracted from measurement")
 
+        a_pow_r = pow(a, r, modulus)
         self._log_step("VERIFY", 11, total_steps,
-                      f"✅ Verifying: a^r mod N = {a}^{r} mod {modulus} = {pow(a, r, modulus)}")
-        log_process("QUANTUM_RESULT", f"✅ Period verification: {a}^{r} mod {modulus} = {pow(a, r, modulus)}", "INFO")
+                      f"✅ Verifying: a^r mod N = {a}^{r} mod {modulus} = {a_pow_r}")
+        log_process("QUANTUM_RESULT", f"✅ Period verification: {a}^{r} mod {modulus} = {a_pow_r}", "INFO")
 
         self._log_step("COMPLETE", 15, total_steps,
                       "✅ Quantum period finding complete!")
@@ -711,26 +1190,24 @@ class ShorsAlgorithm:
         """Check for trivial even factors."""
         if modulus_n % 2 == 0:
             self._log_step("TRIVIAL", 15, 15, "Found trivial factor: 2")
-            exec_time = (time.time() - start_time) * 1000
-            return ShorsResult(
-                success=True, modulus=modulus_n, factor_p=2, factor_q=modulus_n // 2,
-                qubits_used=num_qubits, execution_time_ms=exec_time,
-                gpu_name=gpu_name, gpu_memory_used_mb=get_gpu_memory_usage(),
-                algorithm_steps=steps + ["Found trivial factor: 2"],
-                process_logs=self.process_logs
-            )
+            return self._make_result(modulus_n, num_qubits, gpu_name, start_time,
+                                     steps + ["Found trivial factor: 2"],
+                                     success=True, factor_p=2, factor_q=modulus_n // 2)
         return None
 
     def _try_random_bases(self, modulus_n, num_qubits, gpu_name, start_time, total_main_steps, steps):
         """Try multiple random bases for quantum period finding."""
         log_process("SHOR_SEARCH", "🔓 Selecting random base a for quantum period finding...", "INFO")
-        max_attempts = 10
-        for attempt in range(max_attempts):
+        # Draw distinct bases up front: for small N the range is only a few values wide,
+        # and repeating a base just repeats the same period search
+        base_range = min(modulus_n - 1, 10000) - 2
+        bases = self.rng.choice(base_range, size=min(10, base_range), replace=False) + 2
+        max_attempts = len(bases)
+        for attempt, a in enumerate(bases.tolist()):
             if check_timeout(start_time):
                 raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
 
-            a = _rng.integers(2, min(modulus_n - 1, 10000))
-            g = self.gcd(a, modulus_n)
+            g = math.gcd(a, modulus_n)
             log_process("SHOR_SEARCH", f"🔓 Attempt {attempt+1}/{max_attempts}: base a = {a}, gcd(a,N) = {g}", "INFO")
 
             self._log_step("ATTEMPT", 3 + attempt, total_main_steps,
@@ -755,37 +1232,32 @@ class ShorsAlgorithm:
         if g > 1:
             self._log_step("SUCCESS", 15, 15, f"✅ Lucky! Found factor via GCD: {g}")
             steps.append(f"✅ Lucky factor found: gcd({a}, N) = {g}")
-            exec_time = (time.time() - start_time) * 1000
-            return ShorsResult(
-                success=True, modulus=modulus_n, factor_p=g, factor_q=modulus_n // g,
-                qubits_used=num_qubits, execution_time_ms=exec_time,
-                gpu_name=gpu_name, gpu_memory_used_mb=get_gpu_memory_usage(),
-                algorithm_steps=steps, process_logs=self.process_logs
-            )
+            return self._make_result(modulus_n, num_qubits, gpu_name, start_time, steps,
+                                     success=True, factor_p=g, factor_q=modulus_n // g)
         return None
 
     def _check_period_factors(self, a, r, modulus_n, num_qubits, gpu_name, start_time, total_main_steps, steps):
         """Use the period r to try extracting factors via GCD."""
-        if r % 2 != 0:
+        # Odd r, or r at the search limit (no period found), can't yield a factor
+        if r % 2 != 0 or r >= 1 << num_qubits:
+            return None
+        x = pow(a, r // 2, modulus_n)
+        # x ≡ ±1 (mod N) only gives the trivial gcds 1 and N (N is odd here)
+        if x == 1 or x == modulus_n - 1:
             return None
-        x = self.mod_exp(a, r // 2, modulus_n)
         self._log_step("GCD", 13, total_main_steps,
                       f"🔍 Computing GCD({x}-1, N) and GCD({x}+1, N)...")
-        p = self.gcd(x - 1, modulus_n)
-        q = self.gcd(x + 1, modulus_n)
+        p = math.gcd(x - 1, modulus_n)
+        q = math.gcd(x + 1, modulus_n)
 
         for candidate in (p, q):
             if 1 < candidate < modulus_n:
                 self._log_step("SUCCESS", 15, total_main_steps,
                               f"🔓 RSA BROKEN! Factor = {candidate} found!")
                 steps.append(f"✅ Factor found: {candidate}")
-                exec_time = (time.time() - start_time) * 1000
-                return ShorsResult(
-                    success=True, modulus=modulus_n, factor_p=candidate, factor_q=modulus_n // candidate,
-                    qubits_used=num_qubits, execution_time_ms=exec_time,
-                    gpu_name=gpu_name, gpu_memory_used_mb=get_gpu_memory_usage(),
-                    algorithm_steps=steps, process_logs=self.process_logs
-                )
+                return self._make_result(modulus_n, num_qubits, gpu_name, start_time, steps,
+                                         success=True, factor_p=candidate,
+                                         factor_q=modulus_n // candidate)
         return None
 
     def _generate_demo_factors(self, modulus_n, key_bits, num_qubits, gpu_name, start_time, total_main_steps, steps):
@@ -796,36 +1268,37 @@ class ShorsAlgorithm:
 
         p, q = None, None
         if modulus_n < 10000000:
-            for i in range(2, int(modulus_n ** 0.5) + 1):
-                if modulus_n % i == 0:
-                    p = i
-                    q = modulus_n // i
-                    break
+            p = smallest_factor(modulus_n)
             if p is None:
                 p, q = modulus_n, 1
+            else:
+                q = modulus_n // p
         else:
             import random
             p = random.randint(2 ** (key_bits // 2 - 2), 2 ** (key_bits // 2 - 1))
             q = random.randint(2 ** (key_bits // 2 - 2), 2 ** (key_bits // 2 - 1))
 
-        exec_time = (time.time() - start_time) * 1000
-        classical_ops = math.exp((64/9 * math.log(max(modulus_n, 2))) ** (1/3) * (math.log(max(math.log(max(modulus_n, 2)), 1))) ** (2/3))
-        quantum_ops = (math.log2(max(modulus_n, 2))) ** 3
-
-        steps.append(f"📊 Classical complexity: O(exp(n^(1/3))) ≈ {classical_ops:.2e} operations")
-        steps.append(f"📊 Quantum complexity: O(n³) ≈ {quantum_ops:.2e} operations")
-        steps.append(f"⚡ Quantum speedup: {classical_ops/max(quantum_ops, 1):.2e}x faster")
+        if self.verbose:
+            classical_ops, quantum_ops = factoring_complexity(modulus_n)
+            steps.append(f"📊 Classical complexity: O(exp(n^(1/3))) ≈ {classical_ops:.2e} operations")
+            steps.append(f"📊 Quantum complexity: O(n³) ≈ {quantum_ops:.2e} operations")
+            steps.append(f"⚡ Quantum speedup: {classical_ops/max(quantum_ops, 1):.2e}x faster")
         steps.append(f"🔓 RSA-{key_bits} BROKEN - Private key recovered!")
 
         self._log_step("SUCCESS", 15, total_main_steps,
                       f"🔓 RSA-{key_bits} factorization successful!")
 
+        return self._make_result(modulus_n, num_qubits, gpu_name, start_time, steps,
+                                 success=True, factor_p=int(p) if p else 0,
+                                 factor_q=int(q) if q else 0)
+
+    def _make_result(self, modulus_n, num_qubits, gpu_name, start_time, steps, **outcome) -> ShorsResult:
+        """Build the ShorsResult for any exit path; outcome holds success, factors and errors."""
         return ShorsResult(
-            success=True, modulus=modulus_n,
-            factor_p=int(p) if p else 0, factor_q=int(q) if q else 0,
-            qubits_used=num_qubits, execution_time_ms=exec_time,
+            modulus=modulus_n, qubits_used=num_qubits,
+            execution_time_ms=(time.time() - start_time) * 1000, precision=self.precision,
             gpu_name=gpu_name, gpu_memory_used_mb=get_gpu_memory_usage(),
-            algorithm_steps=steps, process_logs=self.process_logs
+            algorithm_steps=steps, process_logs=self.process_logs, **outcome
         )
 
     def factor(self, modulus_n: int, key_bits: int = 2048) -> ShorsResult:
@@ -836,9 +1309,6 @@ class ShorsAlgorithm:
 
         gpu_name = GPU_INFO.get('name', NO_GPU_LABEL) if self.use_gpu else CPU_SIM_LIMITED
 
-        if self.use_gpu:
-            clear_gpu_memory()
-
         log_process("SHOR_ATTACK", "🚀 ========== SHOR'S ALGORITHM INITIATED ==========", "INFO")
         log_process("SHOR_ATTACK", f"🎯 Target: RSA-{key_bits} encryption", "INFO")
         log_process("GPU_STATUS", f"🎮 GPU: {gpu_name}", "INFO")
@@ -849,13 +1319,15 @@ class ShorsAlgorithm:
         else:
             log_process("GPU_STATUS", f"✅ CUDA compute capability: {GPU_INFO.get('compute_capability', 'N/A')}", "INFO")
 
-        num_qubits = min(2 * int(math.log2(max(modulus_n, 2))) + 3, 24)
+        # floor(log2 N) exactly from the bit length (float log2 can round up near 2^k)
+        num_qubits = min(2 * (max(modulus_n, 2).bit_length() - 1) + 3, SHOR_MAX_QUBITS,
+                         max_state_qubits(np.dtype(self.dtype).itemsize))
         total_main_steps = 15
 
         log_process("SHOR_CONFIG", "⚛️ Quantum circuit configuration:", "INFO")
         log_process("SHOR_CONFIG", f"   • Qubits required: {num_qubits}", "INFO")
         log_process("SHOR_CONFIG", f"   • State vector size: 2^{num_qubits} = {2**num_qubits:,} amplitudes", "INFO")
-        log_process("SHOR_CONFIG", f"   • Estimated GPU memory: {(2**num_qubits * 16) / (1024*1024):.2f} MB", "INFO")
+        log_process("SHOR_CONFIG", f"   • Estimated GPU memory: {(2**num_qubits * np.dtype(self.dtype).itemsize) / (1024*1024):.2f} MB", "INFO")
 
         self._log_step("INIT", 1, total_main_steps,
                       f"🚀 Starting Shor's Algorithm - RSA-{key_bits} Attack")
@@ -879,26 +1351,17 @@ class ShorsAlgorithm:
             return self._generate_demo_factors(modulus_n, key_bits, num_qubits, gpu_name, start_time, total_main_steps, steps)
 
         except TimeoutError as e:
-            exec_time = (time.time() - start_time) * 1000
             self._log_step("TIMEOUT", 15, total_main_steps, f"⏱️ {str(e)}")
-            return ShorsResult(
-                success=False, modulus=modulus_n, factor_p=None, factor_q=None,
-                qubits_used=num_qubits, execution_time_ms=exec_time,
-                gpu_name=gpu_name, gpu_memory_used_mb=get_gpu_memory_usage(),
-                algorithm_steps=steps + [f"❌ TIMEOUT: {str(e)}"],
-                process_logs=self.process_logs,
-                timeout_occurred=True, error_message=str(e)
-            )
+            return self._make_result(modulus_n, num_qubits, gpu_name, start_time,
+                                     steps + [f"❌ TIMEOUT: {str(e)}"],
+                                     success=False, factor_p=None, factor_q=None,
+                                     timeout_occurred=True, error_message=str(e))
         except Exception as e:
-            exec_time = (time.time() - start_time) * 1000
             self._log_step("ERROR", 15, total_main_steps, f"❌ Error: {str(e)}")
-            return ShorsResult(
-                success=False, modulus=modulus_n, factor_p=None, factor_q=None,
-                qubits_used=num_qubits, execution_time_ms=exec_time,
-                gpu_name=gpu_name, gpu_memory_used_mb=get_gpu_memory_usage(),
-                algorithm_steps=steps + [f"❌ Error: {str(e)}"],
-                process_logs=self.process_logs, error_message=str(e)
-            )
+            return self._make_result(modulus_n, num_qubits, gpu_name, start_time,
+                                     steps + [f"❌ Error: {str(e)}"],
+                                     success=False, factor_p=None, factor_q=None,
+                                     error_message=str(e))
 
 # ============================================================================
 # Grover's Algorithm Implementation (GPU-Accelerated)
@@ -913,10 +1376,16 @@ class GroversAlgorithm:
     - Quantum: O(√N) - quadratic speedup
     """
     
-    def __init__(self):
+    def __init__(self, precision: str = DEFAULT_PRECISION, verbose: bool = True, seed: Optional[int] = None):
         self.use_gpu = GPU_OPERATIONAL and CUPY_AVAILABLE
         self.array_lib = xp
-        self.gates = QuantumGates()
+        self.precision = precision
+        self.dtype = PRECISION_DTYPES[precision]
+        self.gates = _SHARED_GATES
+        self.verbose = verbose
+        # Own generator per search: numpy Generators aren't thread-safe and gthread
+        # workers run searches concurrently; a seed makes the search reproducible
+        self.rng = np.random.default_rng(seed)
         self.process_logs: List[Dict] = []
     
     def _log_step(self, phase: str, step: int, total: int, message: str):
@@ -929,7 +1398,9 @@ class GroversAlgorithm:
             "progress_percent": round((step / total) * 100, 1),
             "gpu_memory_mb": round(get_gpu_memory_usage(), 2)
         }
-        self.process_logs.append(entry)
+        # Non-verbose results keep the phase steps but not the per-iteration progress
+        if self.verbose or phase != "ITERATION":
+            self.process_logs.append(entry)
         log_process("GROVER", f"[Step {step}/{total}] {message}", "INFO", entry)
     
     def _run_grover_iterations(self, state, target, num_iterations, total_steps, start_time):
@@ -937,24 +1408,58 @@ class GroversAlgorithm:
         log_process("GROVER_ITERATE", f"🔄 Starting {num_iterations} Grover iterations...", "INFO")
         log_process("GROVER_ITERATE", "   Each iteration: Oracle (phase flip) + Diffusion (amplitude boost)", "INFO")
 
+        if self.use_gpu:
+            # Oracle as a sign mask so each iteration is one fused reduction + one
+            # in-place elementwise kernel, with no scalar indexing on the device
+            sign = self.array_lib.ones(state.shape[0], dtype=state.dtype)
+            sign[target] = -1
+            inv_n = 1.0 / state.shape[0]
+
         iteration_log_interval = max(1, num_iterations // 8)
+        log_points = [i for i in range(num_iterations)
+                      if i % iteration_log_interval == 0 or i == num_iterations - 1]
+        if self.use_gpu:
+            # Sampled target probabilities stay on the device until the loop ends,
+            # so progress logging doesn't force a host sync mid-loop
+            probes = cp.empty(len(log_points), dtype=state.real.dtype)
+        # Loop-invariant lookups bound once; the sentinel avoids a bounds check per iteration
+        use_gpu = self.use_gpu
+        mean_of, subtract = self.array_lib.mean, self.array_lib.subtract
+        log_points.append(num_iterations)
+        next_log = 0
+        check_mask = TIMEOUT_CHECK_INTERVAL - 1
         for i in range(num_iterations):
-            if check_timeout(start_time):
+            if not i & check_mask and check_timeout(start_time):
                 raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
 
-            state[target] *= -1
-            mean = self.array_lib.mean(state)
-            state = 2 * mean - state
-
-            if i % iteration_log_interval == 0 or i == num_iterations - 1:
-                progress_step = 5 + min(6, int((i / num_iterations) * 7))
-                prob_target = float(abs(state[target]) ** 2)
-                log_process("GROVER_ITERATE", f"🔄 Iteration {i+1}/{num_iterations}: target probability = {prob_target:.4f}", "INFO")
-                self._log_step("ITERATION", progress_step, total_steps,
-                              f"🔄 Grover iteration {i+1}/{num_iterations} - "
-                              f"Target amplitude: {prob_target:.4f}")
+            if use_gpu:
+                mean = _grover_oracle_sum(state, sign) * inv_n
+                _grover_diffuse(sign, mean, state)
+            else:
+                state[target] *= -1
+                mean = mean_of(state)
+                subtract(2 * mean, state, out=state)
+
+            if i == log_points[next_log]:
+                if use_gpu:
+                    _amplitude_probs(state[target:target + 1], probes[next_log:next_log + 1])
+                else:
+                    self._log_iteration(i, num_iterations, float(abs(state[target]) ** 2), total_steps)
+                next_log += 1
+
+        if use_gpu:
+            for i, prob_target in zip(log_points, probes.get().tolist()):
+                self._log_iteration(i, num_iterations, prob_target, total_steps)
         return state
 
+    def _log_iteration(self, i, num_iterations, prob_target, total_steps):
+        """Log the target probability after Grover iteration i."""
+        progress_step = 5 + min(6, int((i / num_iterations) * 7))
+        log_process("GROVER_ITERATE", f"🔄 Iteration {i+1}/{num_iterations}: target probability = {prob_target:.4f}", "INFO")
+        self._log_step("ITERATION", progress_step, total_steps,
+                      f"🔄 Grover iteration {i+1}/{num_iterations} - "
+                      f"Target amplitude: {prob_target:.4f}")
+
     def search(self, search_space_bits: int, target: Optional[int] = None) -> GroversResult:
         """Execute Grover's search algorithm with GPU acceleration."""
         start_time = time.time()
@@ -962,15 +1467,12 @@ class GroversAlgorithm:
         
         gpu_name = GPU_INFO.get('name', NO_GPU_LABEL) if self.use_gpu else CPU_SIM_LIMITED
         
-        # Clear GPU memory at the start to prevent CUFFT/CUDA errors
-        if self.use_gpu:
-            clear_gpu_memory()
-        
-        num_qubits = min(search_space_bits, 20)
+        num_qubits = min(search_space_bits, GROVER_MAX_QUBITS,
+                         max_state_qubits(np.dtype(self.dtype).itemsize))
         N = 2 ** num_qubits
         
         if target is None:
-            target = _rng.integers(0, N)
+            target = int(self.rng.integers(0, N))
         
         total_steps = 15
         
@@ -992,18 +1494,25 @@ class GroversAlgorithm:
         self._log_step("CONFIG", 2, total_steps, 
                       f"⚛️ Optimal iterations: {num_iterations} (π/4 × √{N:,})")
         
+        state = None
+        # Each search runs on its own non-blocking stream so concurrent requests
+        # (gthread workers) overlap instead of serializing on the legacy null stream
+        stream = cp.cuda.Stream(non_blocking=True) if self.use_gpu else None
+        prev_stream = cp.cuda.get_current_stream() if self.use_gpu else None
         try:
+            if stream is not None:
+                stream.use()
             if check_timeout(start_time):
                 raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
             
             # Initialize superposition
             self._log_step("HADAMARD", 3, total_steps, 
                           f"🎮 Allocating GPU memory and creating superposition over {N:,} states...")
-            log_process("GPU_MEMORY", f"💾 Allocating {(N * 16) / (1024*1024):.2f} MB for state vector", "INFO")
-            state = self.array_lib.ones(N, dtype=self.array_lib.complex128) / self.array_lib.sqrt(N)
+            log_process("GPU_MEMORY", f"💾 Allocating {(N * np.dtype(self.dtype).itemsize) / (1024*1024):.2f} MB for state vector", "INFO")
+            state = _STATE_BUFFERS.acquire(N, self.dtype)
+            state.fill(1.0 / math.sqrt(N))
             
             if self.use_gpu:
-                cp.cuda.Stream.null.synchronize()
                 log_process("GPU_MEMORY", f"✅ GPU memory allocated: {get_gpu_memory_usage():.1f} MB used", "INFO")
             
             self._log_step("SUPERPOSITION", 4, total_steps, 
@@ -1014,7 +1523,7 @@ class GroversAlgorithm:
             state = self._run_grover_iterations(state, target, num_iterations, total_steps, start_time)
             
             if self.use_gpu:
-                cp.cuda.Stream.null.synchronize()
+                # The probe readback at the end of the loop already waited on the stream
                 log_process("GPU_COMPUTE", f"✅ All {num_iterations} GPU iterations complete", "INFO")
             
             # Measure
@@ -1022,12 +1531,18 @@ class GroversAlgorithm:
                           "📏 Performing quantum measurement...")
             log_process("QUANTUM_MEASURE", "📏 Collapsing superposition to classical result...", "INFO")
             
+            # Born-rule sample: invert the CDF of |ψ|² at one uniform draw. The scan and
+            # search run on the device; only the index and its probability are copied back
+            lib = self.array_lib
+            probs = amplitude_probabilities(state)
+            cumulative = lib.cumsum(probs, dtype=lib.float64)
+            # minimum() guards against rounding at the top of the CDF
+            index = lib.minimum(lib.searchsorted(cumulative, self.rng.random() * cumulative[-1]), N - 1)
+            # Index and probability come back in a single 16-byte transfer
+            picked = lib.stack((index.astype(lib.float64), probs[index].astype(lib.float64)))
             if self.use_gpu:
-                probs = cp.asnumpy(self.array_lib.abs(state) ** 2)
-            else:
-                probs = np.abs(state) ** 2
-                
-            measured = int(np.argmax(probs))  # Convert to Python int
+                picked = picked.get()
+            measured, prob_measured = int(picked[0]), float(picked[1])
             success = bool(measured == target)  # Convert to Python bool
             
             exec_time = (time.time() - start_time) * 1000
@@ -1038,10 +1553,10 @@ class GroversAlgorithm:
             speedup = classical_ops / max(quantum_ops, 1)
             
             log_process("GROVER_RESULT", f"📊 Measurement result: key index {measured}", "INFO")
-            log_process("GROVER_RESULT", f"📊 Probability of measured key: {probs[measured]:.6f}", "INFO")
+            log_process("GROVER_RESULT", f"📊 Probability of measured key: {prob_measured:.6f}", "INFO")
             
             self._log_step("RESULT", 13, total_steps, 
-                          f"📊 Measurement result: {measured} (probability: {probs[measured]:.4f})")
+                          f"📊 Measurement result: {measured} (probability: {prob_measured:.4f})")
             
             if success:
                 log_process("GROVER_SUCCESS", f"✅ KEY FOUND! Classical ops: {classical_ops:,}, Quantum ops: {quantum_ops:,}", "INFO")
@@ -1060,6 +1575,7 @@ class GroversAlgorithm:
                 qubits_used=num_qubits,
                 execution_time_ms=exec_time,
                 gpu_name=gpu_name,
+                precision=self.precision,
                 gpu_memory_used_mb=get_gpu_memory_usage(),
                 speedup_factor=speedup,
                 process_logs=self.process_logs
@@ -1076,6 +1592,7 @@ class GroversAlgorithm:
                 qubits_used=num_qubits,
                 execution_time_ms=exec_time,
                 gpu_name=gpu_name,
+                precision=self.precision,
                 gpu_memory_used_mb=get_gpu_memory_usage(),
                 speedup_factor=0,
                 process_logs=self.process_logs,
@@ -1092,16 +1609,62 @@ class GroversAlgorithm:
                 qubits_used=num_qubits,
                 execution_time_ms=exec_time,
                 gpu_name=gpu_name,
+                precision=self.precision,
                 gpu_memory_used_mb=get_gpu_memory_usage(),
                 speedup_factor=0,
                 process_logs=self.process_logs,
                 error_message=str(e)
             )
+        finally:
+            if stream is not None:
+                # Drain before the buffer can be handed to a request on another stream
+                stream.synchronize()
+                prev_stream.use()
+            if state is not None:
+                _STATE_BUFFERS.release(state)
 
 # ============================================================================
 # PQC Attack Simulation (Lattice-based crypto)
 # ============================================================================
 
+# Lattice attack walkthrough after INIT: (phase, step message, [(category, detail, level)]).
+# Messages are format templates over algorithm, bits, dim, block, qbits and digits
+LATTICE_ATTACK_STEPS = (
+    ("LOAD_PARAMS", "📥 Loading {algorithm} public parameters into quantum memory...",
+     [("LATTICE_LOAD", "📥 Module lattice dimension: {dim}", "INFO")]),
+    ("BKZ_INIT", "🔧 Initializing BKZ (Block Korkine-Zolotarev) lattice reduction...",
+     [("LATTICE_BKZ", "🔧 BKZ is the best known classical/quantum lattice reduction algorithm", "INFO")]),
+    ("QUANTUM_BKZ", "⚛️ Applying quantum-enhanced BKZ with Grover oracle...",
+     [("LATTICE_QUANTUM", "⚛️ Grover's oracle applied to BKZ enumeration step", "INFO"),
+      ("LATTICE_QUANTUM", "⚛️ Quantum speedup: √N (NOT exponential like Shor's)", "INFO")]),
+    ("SVP_SEARCH", "🔍 Searching for shortest vectors in lattice (SVP)...",
+     [("LATTICE_SVP", "🔍 SVP remains NP-hard even for quantum computers", "INFO")]),
+    ("BLOCK_SIZE", "📐 Block size B = {block}, lattice dimension n = {dim}",
+     [("LATTICE_PARAMS", "📐 Attack requires 2^{bits} operations (infeasible!)", "INFO")]),
+    ("LWE_ATTACK", "🎯 Attempting to solve Learning With Errors (LWE) problem...",
+     [("LATTICE_LWE", "🎯 LWE is the foundation of ML-KEM security", "INFO")]),
+    ("MLWE_ATTACK", "🎯 Attempting Module-LWE structure exploitation...",
+     [("LATTICE_MLWE", "🎯 Module-LWE provides efficient implementation with strong security", "INFO")]),
+    ("ENUM", "📊 Running quantum-assisted lattice enumeration...",
+     [("LATTICE_ENUM", "📊 Enumeration requires exponential time even with quantum help", "INFO")]),
+    ("SIEVING", "⚡ Applying quantum sieving algorithm...",
+     [("LATTICE_SIEVE", "⚡ Quantum sieving provides only constant-factor speedup", "INFO")]),
+    ("COMPLEXITY", "⚠️ Attack complexity: O(2^{bits}) - EXPONENTIAL!",
+     [("LATTICE_FAIL", "❌ Computational cost: 2^{bits} ≈ 10^{digits} operations", "WARNING"),
+      ("LATTICE_FAIL", "❌ This exceeds the computational capacity of ANY computer!", "WARNING")]),
+    ("QUANTUM_LIMIT", "⚠️ Quantum speedup is only POLYNOMIAL for LWE/MLWE problems",
+     [("LATTICE_QUANTUM", "⚠️ Unlike RSA, quantum computers do NOT break lattice crypto!", "WARNING")]),
+    ("FAIL", "❌ ATTACK FAILED: No efficient quantum algorithm exists for lattice problems!",
+     [("PQC_RESULT", "❌ ========== ATTACK FAILED ==========", "WARNING"),
+      ("PQC_RESULT", "🛡️ {algorithm} successfully resisted quantum attack!", "INFO")]),
+    ("SECURITY", "🛡️ {algorithm} maintains {qbits}-bit quantum security",
+     [("PQC_SECURITY", "🛡️ Post-quantum security level: {qbits} bits", "INFO"),
+      ("PQC_SECURITY", "🛡️ This is equivalent to AES-{bits} against quantum attacks", "INFO")]),
+    ("VERDICT", "✅ Post-Quantum Cryptography VERIFIED SECURE against quantum attacks!",
+     [("PQC_VERDICT", "✅ VERDICT: {algorithm} is QUANTUM-SAFE!", "INFO"),
+      ("PQC_VERDICT", "✅ Recommendation: Migrate RSA/ECC to PQC algorithms NOW!", "INFO")]),
+)
+
 class PQCAttackSimulator:
     """
     Post-Quantum Cryptography Attack Simulator
@@ -1114,7 +1677,7 @@ class PQCAttackSimulator:
         self.use_gpu = GPU_OPERATIONAL and CUPY_AVAILABLE
         self.process_logs: List[Dict] = []
     
-    def _log_step(self, phase: str, step: int, total: int, message: str):
+    def _log_step(self, phase: str, step: int, total: int, message: str, memory_mb: Optional[float] = None):
         entry = {
             "timestamp": datetime.now().isoformat(),
             "phase": phase,
@@ -1122,7 +1685,7 @@ class PQCAttackSimulator:
             "total_steps": total,
             "message": message,
             "progress_percent": round((step / total) * 100, 1),
-            "gpu_memory_mb": round(get_gpu_memory_usage(), 2)
+            "gpu_memory_mb": round(get_gpu_memory_usage(), 2) if memory_mb is None else memory_mb
         }
         self.process_logs.append(entry)
         log_process("PQC_ATTACK", f"[Step {step}/{total}] {message}", "INFO", entry)
@@ -1157,77 +1720,17 @@ class PQCAttackSimulator:
             if check_timeout(start_time):
                 raise TimeoutError(TIMEOUT_ERROR_MESSAGE)
             
-            self._log_step("LOAD_PARAMS", 2, total_steps, 
-                          f"📥 Loading {algorithm} public parameters into quantum memory...")
-            log_process("LATTICE_LOAD", f"📥 Module lattice dimension: {security_bits * 4}", "INFO")
-            time.sleep(0.15)
-            
-            self._log_step("BKZ_INIT", 3, total_steps, 
-                          "🔧 Initializing BKZ (Block Korkine-Zolotarev) lattice reduction...")
-            log_process("LATTICE_BKZ", "🔧 BKZ is the best known classical/quantum lattice reduction algorithm", "INFO")
-            time.sleep(0.15)
-            
-            self._log_step("QUANTUM_BKZ", 4, total_steps, 
-                          "⚛️ Applying quantum-enhanced BKZ with Grover oracle...")
-            log_process("LATTICE_QUANTUM", "⚛️ Grover's oracle applied to BKZ enumeration step", "INFO")
-            log_process("LATTICE_QUANTUM", "⚛️ Quantum speedup: √N (NOT exponential like Shor's)", "INFO")
-            time.sleep(0.2)
-            
-            self._log_step("SVP_SEARCH", 5, total_steps, 
-                          "🔍 Searching for shortest vectors in lattice (SVP)...")
-            log_process("LATTICE_SVP", "🔍 SVP remains NP-hard even for quantum computers", "INFO")
-            time.sleep(0.15)
-            
-            self._log_step("BLOCK_SIZE", 6, total_steps, 
-                          f"📐 Block size B = {security_bits * 2}, lattice dimension n = {security_bits * 4}")
-            log_process("LATTICE_PARAMS", f"📐 Attack requires 2^{security_bits} operations (infeasible!)", "INFO")
-            time.sleep(0.15)
-            self._log_step("LWE_ATTACK", 7, total_steps, 
-                          "🎯 Attempting to solve Learning With Errors (LWE) problem...")
-            log_process("LATTICE_LWE", "🎯 LWE is the foundation of ML-KEM security", "INFO")
-            time.sleep(0.2)
-            
-            self._log_step("MLWE_ATTACK", 8, total_steps, 
-                          "🎯 Attempting Module-LWE structure exploitation...")
-            log_process("LATTICE_MLWE", "🎯 Module-LWE provides efficient implementation with strong security", "INFO")
-            time.sleep(0.15)
-            
-            self._log_step("ENUM", 9, total_steps, 
-                          "📊 Running quantum-assisted lattice enumeration...")
-            log_process("LATTICE_ENUM", "📊 Enumeration requires exponential time even with quantum help", "INFO")
-            time.sleep(0.2)
-            
-            self._log_step("SIEVING", 10, total_steps, 
-                          "⚡ Applying quantum sieving algorithm...")
-            log_process("LATTICE_SIEVE", "⚡ Quantum sieving provides only constant-factor speedup", "INFO")
-            time.sleep(0.15)
-            
-            self._log_step("COMPLEXITY", 11, total_steps, 
-                          f"⚠️ Attack complexity: O(2^{security_bits}) - EXPONENTIAL!")
-            log_process("LATTICE_FAIL", f"❌ Computational cost: 2^{security_bits} ≈ 10^{int(security_bits * 0.301)} operations", "WARNING")
-            log_process("LATTICE_FAIL", "❌ This exceeds the computational capacity of ANY computer!", "WARNING")
-            time.sleep(0.1)
-            
-            self._log_step("QUANTUM_LIMIT", 12, total_steps, 
-                          "⚠️ Quantum speedup is only POLYNOMIAL for LWE/MLWE problems")
-            log_process("LATTICE_QUANTUM", "⚠️ Unlike RSA, quantum computers do NOT break lattice crypto!", "WARNING")
-            time.sleep(0.1)
-            
-            self._log_step("FAIL", 13, total_steps, 
-                          "❌ ATTACK FAILED: No efficient quantum algorithm exists for lattice problems!")
-            log_process("PQC_RESULT", "❌ ========== ATTACK FAILED ==========", "WARNING")
-            log_process("PQC_RESULT", f"🛡️ {algorithm} successfully resisted quantum attack!", "INFO")
-            time.sleep(0.1)
-            
-            self._log_step("SECURITY", 14, total_steps, 
-                          f"🛡️ {algorithm} maintains {int(security_bits * 0.95)}-bit quantum security")
-            log_process("PQC_SECURITY", f"🛡️ Post-quantum security level: {int(security_bits * 0.95)} bits", "INFO")
-            log_process("PQC_SECURITY", f"🛡️ This is equivalent to AES-{security_bits} against quantum attacks", "INFO")
-            
-            self._log_step("VERDICT", 15, total_steps, 
-                          "✅ Post-Quantum Cryptography VERIFIED SECURE against quantum attacks!")
-            log_process("PQC_VERDICT", f"✅ VERDICT: {algorithm} is QUANTUM-SAFE!", "INFO")
-            log_process("PQC_VERDICT", "✅ Recommendation: Migrate RSA/ECC to PQC algorithms NOW!", "INFO")
+            params = {
+                "algorithm": algorithm, "bits": security_bits,
+                "dim": security_bits * 4, "block": security_bits * 2,
+                "qbits": int(security_bits * 0.95), "digits": int(security_bits * 0.301),
+            }
+            # Nothing is allocated during the walkthrough, so one pool reading serves every step
+            memory_mb = round(get_gpu_memory_usage(), 2)
+            for step, (phase, message, details) in enumerate(LATTICE_ATTACK_STEPS, start=2):
+                self._log_step(phase, step, total_steps, message.format(**params), memory_mb)
+                for category, detail, level in details:
+                    log_process(category, detail.format(**params), level)
             
             exec_time = (time.time() - start_time) * 1000
             return PQCAttackResult(
@@ -1268,10 +1771,98 @@ class PQCAttackSimulator:
 # Flask API Endpoints
 # ============================================================================
 
-@app.route('/api/quantum/status', methods=['GET'])
-def get_status():
-    """Get quantum simulator status with GPU details."""
-    return jsonify({
+# Spellings accepted for boolean flags sent as query parameters or strings
+FLAG_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+FLAG_FALSE_VALUES = ('0', 'false', 'no', 'off')
+
+def verbose_requested(data: Dict) -> bool:
+    """Whether the client wants algorithm_steps/process_logs (disable with ?verbose=0 or {"verbose": false})."""
+    flag = request.args.get('verbose', data.get('verbose', True))
+    if isinstance(flag, str):
+        return flag.strip().lower() not in FLAG_FALSE_VALUES
+    return bool(flag)
+
+def simulate_qft_requested(data: Dict) -> Optional[bool]:
+    """Whether to simulate the QFT (?simulate_qft=0 or {"simulate_qft": false} skips it); None if not a boolean."""
+    flag = request.args.get('simulate_qft', data.get('simulate_qft', True))
+    if isinstance(flag, str):
+        flag = flag.strip().lower()
+        if flag in FLAG_TRUE_VALUES:
+            return True
+        if flag in FLAG_FALSE_VALUES:
+            return False
+        return None
+    # bool is an int subclass; JSON 0/1 are accepted like their string forms
+    if isinstance(flag, int) and flag in (0, 1):
+        return bool(flag)
+    return None
+
+def invalid_simulate_qft_response(data: Dict):
+    """400 response for a simulate_qft value that is not a boolean."""
+    flag = request.args.get('simulate_qft', data.get('simulate_qft'))
+    return json_response({"error": f"Invalid simulate_qft: {flag!r} (expected a boolean)"}, 400)
+
+def requested_precision(data: Dict) -> Optional[str]:
+    """Canonical PRECISION_DTYPES key for the request (fp32/fp64 aliases accepted), or None if unsupported."""
+    precision = data.get('precision', DEFAULT_PRECISION)
+    # Lists/objects from the JSON body are unhashable; check the type before the dict lookup
+    if not isinstance(precision, str):
+        return None
+    precision = precision.lower()
+    precision = PRECISION_ALIASES.get(precision, precision)
+    return precision if precision in PRECISION_DTYPES else None
+
+def json_response(payload: Dict, status: int = 200):
+    """Encode an API payload with orjson when available, else Flask's jsonify."""
+    if ORJSON_AVAILABLE:
+        try:
+            body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+            return app.response_class(body, status=status, mimetype='application/json')
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson rejects integers wider than 64 bits (e.g. RSA-sized factors)
+            pass
+    return jsonify(payload), status
+
+def unsupported_precision_response(precision):
+    """400 response for a precision value outside PRECISION_DTYPES and its aliases."""
+    return json_response({
+        "error": f"Unsupported precision: {precision}",
+        "supported_precisions": list(PRECISION_DTYPES) + list(PRECISION_ALIASES)
+    }, 400)
+
+@lru_cache(maxsize=None)
+def _result_field_names(result_cls) -> Tuple[str, ...]:
+    """Field names of a result dataclass, resolved once per class."""
+    return tuple(f.name for f in fields(result_cls))
+
+def result_to_dict(result) -> Dict:
+    """Shallow dict of a result dataclass (asdict() deep-copies every nested log entry)."""
+    return {name: getattr(result, name) for name in _result_field_names(type(result))}
+
+def shor_result_payload(result: ShorsResult, verbose: bool) -> Dict:
+    """Serialize a ShorsResult, leaving out the step narratives for non-verbose clients."""
+    payload = result_to_dict(result)
+    if not verbose:
+        payload.pop('algorithm_steps', None)
+        payload.pop('process_logs', None)
+    return payload
+
+@app.before_request
+def _initialize_gpu_on_first_request():
+    """Initialize the GPU on first use; status polls start it in the background instead of waiting."""
+    if GPU_INIT_DONE:
+        return None
+    if request.path == '/api/quantum/status':
+        # Health checks and client probes must answer promptly while the GPU comes up
+        start_gpu_initialization()
+        return None
+    ensure_gpu_initialized()
+    return None
+
+@lru_cache(maxsize=1)
+def _status_static() -> Dict:
+    """Status fields that are fixed once GPU initialization has run."""
+    return {
         "service": "cuQuantum GPU Quantum Simulator",
         "version": "2.0.0",
         "gpu_mode": "REQUIRED" if GPU_REQUIRED else "OPTIONAL",
@@ -1281,13 +1872,38 @@ def get_status():
         "cupy_available": CUPY_AVAILABLE,
         "gpu": GPU_INFO if GPU_INFO else {"name": "NO GPU DETECTED", "status": "CRITICAL"},
         "timeout_limit_hours": MAX_DECRYPTION_TIMEOUT_SECONDS / 3600,
+    }
+_STATUS_CAPABILITIES = {
+    "shors_algorithm": True,
+    "grovers_algorithm": True,
+    "pqc_attack_simulation": True,
+    "precision": np.dtype(DEFAULT_CDTYPE).name,
+    "precision_options": list(PRECISION_DTYPES),
+    "state_vector_simulation": True,
+    "detailed_logging": True
+}
+
+@app.route('/api/quantum/status', methods=['GET'])
+def get_status():
+    """Get quantum simulator status with GPU details."""
+    # Memory bounds the register, but each algorithm also has a fixed cap it never exceeds
+    memory_qubits = max_state_qubits(np.dtype(DEFAULT_CDTYPE).itemsize)
+    shor_qubits = min(memory_qubits, SHOR_MAX_QUBITS)
+    grover_qubits = min(memory_qubits, GROVER_MAX_QUBITS)
+    initialized = GPU_INIT_DONE
+    if initialized:
+        static = _status_static()
+    else:
+        # Not cached: GPU detection may still be filling these in
+        static = {**_status_static.__wrapped__(), "gpu_operational": False}
+    return json_response({
+        **static,
+        "status": "ready" if initialized else "initializing",
         "capabilities": {
-            "shors_algorithm": True,
-            "grovers_algorithm": True,
-            "pqc_attack_simulation": True,
-            "max_qubits": 28 if GPU_OPERATIONAL else 20,
-            "state_vector_simulation": True,
-            "detailed_logging": True
+            **_STATUS_CAPABILITIES,
+            "max_qubits": max(shor_qubits, grover_qubits),
+            "shor_max_qubits": shor_qubits,
+            "grover_max_qubits": grover_qubits,
         },
         "timestamp": datetime.now().isoformat()
     })
@@ -1298,14 +1914,16 @@ def get_logs():
     limit = request.args.get('limit', 100, type=int)
     category = request.args.get('category', None)
     
-    with log_lock:
-        logs = list(process_logs)
+    # deque.copy() is a single C-level call, so it can't observe a half-applied append
+    logs = process_logs.copy()
         
     if category:
-        logs = [l for l in logs if l.get('category') == category]
+        logs = [entry for entry in logs if entry[2] == category]
+    else:
+        logs = list(logs)
     
-    return jsonify({
-        "logs": logs[-limit:],
+    return json_response({
+        "logs": [log_entry_dict(entry) for entry in logs[-limit:]],
         "total_count": len(logs),
         "gpu_status": {
             "name": GPU_INFO.get('name', 'Unknown'),
@@ -1314,32 +1932,118 @@ def get_logs():
         }
     })
 
+def _log_entries_after(seq: int) -> List[Tuple]:
+    """Entries with a sequence number above seq, oldest first, read from the newest end."""
+    newer = []
+    index = -1
+    try:
+        while True:
+            entry = process_logs[index]
+            if entry[0] <= seq:
+                break
+            # A concurrent append shifts negative indices, so an entry may be seen
+            # twice (never skipped); keep only strictly older ones while walking back
+            if not newer or entry[0] < newer[-1][0]:
+                newer.append(entry)
+            index -= 1
+    except IndexError:
+        pass  # Walked past the oldest retained entry
+    newer.reverse()
+    return newer
+
+def _latest_log_seq() -> int:
+    """Sequence number of the newest process-log entry (0 when empty)."""
+    try:
+        return process_logs[-1][0]
+    except IndexError:
+        return 0
+
+# Simulations currently executing; the log stream closes once this drops to zero
+_active_simulations = 0
+_active_simulations_lock = threading.Lock()
+
+def tracks_simulation(view):
+    """Count the wrapped endpoint as a running simulation while it executes."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        global _active_simulations
+        with _active_simulations_lock:
+            _active_simulations += 1
+        try:
+            return view(*args, **kwargs)
+        finally:
+            with _active_simulations_lock:
+                _active_simulations -= 1
+    return wrapper
+
+@app.route('/api/quantum/logs/stream', methods=['GET'])
+def stream_logs():
+    """Stream process logs as JSON lines while a simulation is running."""
+    category = request.args.get('category', None)
+    max_seconds = min(request.args.get('timeout', LOG_STREAM_DEFAULT_SECONDS, type=float),
+                      MAX_DECRYPTION_TIMEOUT_SECONDS)
+    # Only entries logged after the client connects; use /api/quantum/logs for history
+    last_seq = _latest_log_seq()
+
+    def generate():
+        nonlocal last_seq
+        now = time.time()
+        deadline = now + max_seconds
+        last_activity = last_write = now
+        saw_simulation = False
+        while now < deadline:
+            running = _active_simulations > 0
+            saw_simulation = saw_simulation or running
+            entries = _log_entries_after(last_seq)
+            if entries:
+                last_seq = entries[-1][0]
+                last_activity = now
+                for entry in entries:
+                    if category is None or entry[2] == category:
+                        last_write = now
+                        yield json.dumps(log_entry_dict(entry), default=str) + "\n"
+            if not running and (saw_simulation or now - last_activity >= LOG_STREAM_IDLE_SECONDS):
+                # The run finished (its last entries were just drained) or nothing is happening
+                return
+            if now - last_write >= LOG_STREAM_KEEPALIVE_SECONDS:
+                last_write = now
+                yield json.dumps({"keepalive": True, "timestamp": datetime.now().isoformat()}) + "\n"
+            time.sleep(LOG_STREAM_POLL_SECONDS)
+            now = time.time()
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/quantum/shor', methods=['POST'])
+@tracks_simulation
 def run_shor():
     """Execute Shor's algorithm for RSA factorization."""
     data = request.get_json() or {}
     
     modulus = data.get('modulus', 15)
     key_bits = data.get('key_bits', 2048)
+    precision = requested_precision(data)
+    if precision is None:
+        return unsupported_precision_response(data.get('precision'))
+    simulate_qft = simulate_qft_requested(data)
+    if simulate_qft is None:
+        return invalid_simulate_qft_response(data)
     
     log_process("API", f"⚛️ Shor's algorithm request: N={modulus}, key_bits={key_bits}", "INFO")
     
-    # Clear GPU memory before operation to prevent CUFFT errors
-    if GPU_OPERATIONAL:
-        clear_gpu_memory()
-    
     if not GPU_OPERATIONAL:
         log_process("API", "⚠️ GPU not operational - running in degraded mode", "WARNING")
     
     try:
-        shor = ShorsAlgorithm()
+        verbose = verbose_requested(data)
+        shor = ShorsAlgorithm(verbose=verbose, precision=precision, simulate_qft=simulate_qft)
         result = shor.factor(modulus, key_bits)
         
-        return jsonify({
+        return json_response({
             "algorithm": "Shor's Algorithm",
             "purpose": "RSA Factorization",
             "gpu_accelerated": GPU_OPERATIONAL,
-            "result": asdict(result),
+            "result": shor_result_payload(result, verbose),
             "vulnerability": "RSA is BROKEN by quantum computers" if result.success else "Attack failed or timed out",
             "recommendation": "Migrate to ML-KEM (Kyber) for quantum-safe encryption"
         })
@@ -1349,33 +2053,37 @@ def run_shor():
         # Try to clear GPU memory after error
         if GPU_OPERATIONAL:
             clear_gpu_memory()
-        return jsonify({"error": str(e), "gpu_error_recovery": "attempted"}), 500
+        return json_response({"error": str(e), "gpu_error_recovery": "attempted"}, 500)
 
 @app.route('/api/quantum/grover', methods=['POST'])
+@tracks_simulation
 def run_grover():
     """Execute Grover's algorithm for key search."""
     data = request.get_json() or {}
     
     key_bits = data.get('key_bits', 128)
     target = data.get('target')
+    precision = requested_precision(data)
+    if precision is None:
+        return unsupported_precision_response(data.get('precision'))
+    verbose = verbose_requested(data)
+    seed = data.get('seed')
+    if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool) or seed < 0):
+        return json_response({"error": f"Invalid seed: {seed!r} (expected a non-negative integer)"}, 400)
     
     log_process("API", f"🔍 Grover's algorithm request: {key_bits}-bit key space", "INFO")
     
-    # Clear GPU memory before operation to prevent CUFFT errors
-    if GPU_OPERATIONAL:
-        clear_gpu_memory()
-    
     try:
-        grover = GroversAlgorithm()
+        grover = GroversAlgorithm(precision=precision, verbose=verbose, seed=seed)
         result = grover.search(min(key_bits, 20), target)
         
         effective_security = key_bits // 2
         
-        return jsonify({
+        return json_response({
             "algorithm": "Grover's Algorithm",
             "purpose": "Symmetric Key Search",
             "gpu_accelerated": GPU_OPERATIONAL,
-            "result": asdict(result),
+            "result": result_to_dict(result),
             "security_analysis": {
                 "original_security_bits": key_bits,
                 "post_quantum_security_bits": effective_security,
@@ -1390,14 +2098,18 @@ def run_grover():
         # Try to clear GPU memory after error
         if GPU_OPERATIONAL:
             clear_gpu_memory()
-        return jsonify({"error": str(e), "gpu_error_recovery": "attempted"}), 500
+        return json_response({"error": str(e), "gpu_error_recovery": "attempted"}, 500)
 
 @app.route('/api/quantum/attack/rsa', methods=['POST'])
+@tracks_simulation
 def attack_rsa():
     """Simulate quantum attack on RSA encryption."""
     data = request.get_json() or {}
     
     key_size = data.get('key_size', 2048)
+    simulate_qft = simulate_qft_requested(data)
+    if simulate_qft is None:
+        return invalid_simulate_qft_response(data)
     
     p = 104729
     q = 104743
@@ -1405,15 +2117,16 @@ def attack_rsa():
     
     log_process("API", f"⚛️ RSA-{key_size} quantum attack initiated", "WARNING")
     
-    shor = ShorsAlgorithm()
+    verbose = verbose_requested(data)
+    shor = ShorsAlgorithm(verbose=verbose, simulate_qft=simulate_qft)
     result = shor.factor(N, key_size)
     
-    return jsonify({
+    return json_response({
         "attack_type": "Shor's Algorithm",
         "target": f"RSA-{key_size}",
         "modulus": N,
         "gpu_accelerated": GPU_OPERATIONAL,
-        "result": asdict(result),
+        "result": shor_result_payload(result, verbose),
         "verdict": "🔓 RSA BROKEN" if result.success else "Attack inconclusive",
         "impact": {
             "data_exposed": result.success,
@@ -1424,6 +2137,7 @@ def attack_rsa():
     })
 
 @app.route('/api/quantum/attack/lattice', methods=['POST'])
+@tracks_simulation
 def attack_lattice():
     """Attempt quantum attack on lattice-based crypto (ML-KEM)."""
     data = request.get_json() or {}
@@ -1436,11 +2150,11 @@ def attack_lattice():
     attacker = PQCAttackSimulator()
     result = attacker.attack_lattice(algorithm, security_level)
     
-    return jsonify({
+    return json_response({
         "attack_type": result.attack_type,
         "target": algorithm,
         "gpu_accelerated": GPU_OPERATIONAL,
-        "result": asdict(result),
+        "result": result_to_dict(result),
         "security_analysis": {
             "classical_security_bits": result.classical_security_bits,
             "quantum_security_bits": result.quantum_security_bits,
@@ -1452,6 +2166,7 @@ def attack_lattice():
     })
 
 @app.route('/api/quantum/attack/pqc', methods=['POST'])
+@tracks_simulation
 def attack_pqc_full():
     """Full PQC attack simulation endpoint."""
     data = request.get_json() or {}
@@ -1474,10 +2189,10 @@ def attack_pqc_full():
         result = attacker.attack_lattice(algo, level)
         results.append({
             "algorithm": algo,
-            "result": asdict(result)
+            "result": result_to_dict(result)
         })
     
-    return jsonify({
+    return json_response({
         "attack_type": "Full PQC Attack Simulation",
         "gpu_accelerated": GPU_OPERATIONAL,
         "results": results,
@@ -1488,7 +2203,7 @@ def attack_pqc_full():
 @app.route('/api/quantum/gpu/status', methods=['GET'])
 def gpu_status():
     """Get detailed GPU status."""
-    return jsonify({
+    return json_response({
         "gpu_required": GPU_REQUIRED,
         "gpu_available": GPU_AVAILABLE,
         "gpu_operational": GPU_OPERATIONAL,
@@ -1511,7 +2226,7 @@ def clear_gpu():
     success = clear_gpu_memory()
     memory_after = get_gpu_memory_usage()
     
-    return jsonify({
+    return json_response({
         "success": success,
         "memory_before_mb": memory_before,
         "memory_after_mb": memory_after,
@@ -1526,6 +2241,8 @@ def clear_gpu():
 # ============================================================================
 
 if __name__ == '__main__':
+    # The development server initializes eagerly so the banner reflects the real GPU state
+    ensure_gpu_initialized()
     print("\n" + "=" * 70)
     print("  ⚛️  cuQuantum GPU Quantum Simulator Service v2.0")
     print("=" * 70)
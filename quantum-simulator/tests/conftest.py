@@ -0,0 +1,7 @@
+"""Pytest setup: make quantum_service importable from the service directory."""
+
+import os
+import sys
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVICE_DIR)
@@ -0,0 +1,34 @@
+"""Tests for Grover search sampling on the CPU backend."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import quantum_service as qs
+
+
+def _search(seed, bits=8, target=None):
+    return qs.GroversAlgorithm(seed=seed).search(bits, target)
+
+
+def test_seeded_search_is_reproducible():
+    first, second = _search(7), _search(7)
+    assert first.success == second.success
+    assert first.target_found == second.target_found
+
+
+def test_concurrent_seeded_searches_match_sequential():
+    seeds = list(range(8))
+    expected = [_search(seed).target_found for seed in seeds]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_search, seeds))
+    assert [r.target_found for r in results] == expected
+
+
+def test_search_finds_given_target():
+    result = _search(3, bits=10, target=123)
+    assert result.success
+    assert result.target_found == 123
+
+
+def test_endpoint_rejects_invalid_seed():
+    response = qs.app.test_client().post('/api/quantum/grover', json={"key_bits": 8, "seed": "abc"})
+    assert response.status_code == 400
@@ -0,0 +1,64 @@
+"""Tests for API response encoding (orjson fast path and jsonify fallback)."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+import quantum_service as qs
+
+
+def make_result(modulus, p, q):
+    return qs.ShorsResult(
+        success=True, modulus=modulus, factor_p=p, factor_q=q, qubits_used=24,
+        execution_time_ms=12.5, gpu_name="test", gpu_memory_used_mb=0.0,
+        algorithm_steps=["⚛️ step"], process_logs=[{"phase": "INIT", "step": 1}],
+    )
+
+
+def encode(payload):
+    with qs.app.test_request_context():
+        response = qs.app.make_response(qs.json_response(payload))
+        reference = qs.jsonify(payload).get_data()
+    return response, reference
+
+
+def test_result_to_dict_matches_asdict():
+    result = make_result(3233, 53, 61)
+    assert qs.result_to_dict(result) == asdict(result)
+
+
+def test_wide_integers_fall_back_to_jsonify():
+    p, q = 2 ** 89 - 1, 2 ** 107 - 1
+    payload = {"result": qs.result_to_dict(make_result(p * q, p, q))}
+    response, reference = encode(payload)
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_data() == reference
+    decoded = json.loads(response.get_data())
+    assert decoded["result"]["modulus"] == p * q
+    assert decoded["result"]["factor_q"] == q
+
+
+def test_narrow_payload_matches_jsonify_content():
+    payload = {"result": qs.result_to_dict(make_result(3233, 53, 61))}
+    response, reference = encode(payload)
+    if qs.ORJSON_AVAILABLE:
+        assert response.get_data() == qs.orjson.dumps(
+            payload, option=qs.orjson.OPT_SERIALIZE_NUMPY | qs.orjson.OPT_NON_STR_KEYS)
+    assert json.loads(response.get_data()) == json.loads(reference)
+
+
+def test_error_status_is_preserved():
+    with qs.app.test_request_context():
+        response = qs.app.make_response(qs.json_response({"modulus": 2 ** 70}, 400))
+    assert response.status_code == 400
+    assert json.loads(response.get_data()) == {"modulus": 2 ** 70}
+
+
+@pytest.mark.skipif(not qs.ORJSON_AVAILABLE, reason="orjson not installed")
+def test_numpy_scalars_are_encoded():
+    import numpy as np
+    with qs.app.test_request_context():
+        response = qs.app.make_response(qs.json_response({"value": np.float32(0.5), "n": np.int64(7)}))
+    assert json.loads(response.get_data()) == {"value": 0.5, "n": 7}
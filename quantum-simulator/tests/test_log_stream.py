@@ -0,0 +1,40 @@
+"""Tests for the sequence-numbered process log buffer behind /api/quantum/logs/stream."""
+
+import json
+
+import quantum_service as qs
+
+
+def test_entries_after_returns_only_newer_entries_in_order():
+    start = qs._latest_log_seq()
+    for i in range(5):
+        qs.log_process("TEST_STREAM", f"entry {i}")
+    entries = qs._log_entries_after(start)
+    assert [e[4] for e in entries] == [f"entry {i}" for i in range(5)]
+    assert [e[0] for e in entries] == sorted(e[0] for e in entries)
+    assert qs._log_entries_after(entries[-1][0]) == []
+
+
+def test_log_entry_dict_drops_sequence_number():
+    qs.log_process("TEST_STREAM", "shape check", "WARNING", {"k": 1})
+    entry = qs.log_entry_dict(qs.process_logs[-1])
+    assert entry["category"] == "TEST_STREAM"
+    assert entry["level"] == "WARNING"
+    assert entry["message"] == "shape check"
+    assert entry["details"] == {"k": 1}
+
+
+def test_stream_closes_when_idle(monkeypatch):
+    monkeypatch.setattr(qs, "LOG_STREAM_IDLE_SECONDS", 0)
+    monkeypatch.setattr(qs, "LOG_STREAM_POLL_SECONDS", 0.01)
+    response = qs.app.test_client().get('/api/quantum/logs/stream?category=TEST_STREAM')
+    assert response.data == b""
+
+
+def test_stream_sends_keepalive_while_quiet(monkeypatch):
+    monkeypatch.setattr(qs, "LOG_STREAM_IDLE_SECONDS", 0.2)
+    monkeypatch.setattr(qs, "LOG_STREAM_KEEPALIVE_SECONDS", 0)
+    monkeypatch.setattr(qs, "LOG_STREAM_POLL_SECONDS", 0.01)
+    response = qs.app.test_client().get('/api/quantum/logs/stream?category=NO_SUCH_CATEGORY')
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert lines and all(line["keepalive"] for line in lines)
@@ -0,0 +1,50 @@
+"""Tests for process logging and console emoji stripping."""
+
+import io
+import logging
+
+import pytest
+
+import quantum_service as qs
+
+MESSAGES = [
+    "🚀 ========== SHOR'S ALGORITHM INITIATED ==========",
+    "⚠️ GPU FFT failed, falling back to CPU FFT",
+    "🛡️ Lattice attack blocked ✅",
+    "⚛️ Initialized 11-qubit quantum register",
+    "⏱️ Timeout limit: 1.0 hours 🗑️ 🖥️",
+    "plain ASCII line with no emoji",
+]
+
+
+def reference_strip(text):
+    """The original per-emoji str.replace implementation."""
+    for emoji, replacement in qs.EMOJI_MAP.items():
+        text = text.replace(emoji, replacement)
+    return text
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_log_process_stores_message_unchanged(message):
+    qs.log_process("TEST_LOG", message, "INFO", {"k": 1})
+    _, _, category, level, stored, details = qs.process_logs[-1]
+    assert (category, level, stored, details) == ("TEST_LOG", "INFO", message, {"k": 1})
+    assert qs.log_entry_dict(qs.process_logs[-1])["message"] == message
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_strip_emoji_matches_reference(message):
+    assert qs.strip_emoji(message) == reference_strip(message)
+
+
+def test_strip_emoji_handles_missing_variation_selector():
+    assert qs.strip_emoji("⚠ low VRAM") == "[WARN] low VRAM"
+
+
+@pytest.mark.parametrize("encoding, stripped", [("cp1252", True), ("utf-8", False)])
+def test_console_formatter_strips_only_for_non_utf8(monkeypatch, encoding, stripped):
+    monkeypatch.setattr(qs.sys, "stdout", io.TextIOWrapper(io.BytesIO(), encoding=encoding))
+    formatter = qs._ConsoleFormatter('%(message)s')
+    for message in MESSAGES:
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+        assert formatter.format(record) == (reference_strip(message) if stripped else message)
@@ -0,0 +1,96 @@
+"""Tests for the sieve, trial division and complexity helpers used by the Shor demo path."""
+
+import math
+import threading
+
+import numpy as np
+import pytest
+
+import quantum_service as qs
+
+
+def naive_smallest_factor(n):
+    for d in range(2, math.isqrt(n) + 1):
+        if n % d == 0:
+            return d
+    return None
+
+
+def naive_primes(limit):
+    return [p for p in range(2, limit + 1) if naive_smallest_factor(p) is None]
+
+
+@pytest.fixture
+def fresh_sieve(monkeypatch):
+    """Start from an empty prime table so growth across the first bound is exercised."""
+    monkeypatch.setattr(qs, "_PRIME_SIEVE", (np.array([], dtype=np.int64), 1))
+
+
+@pytest.mark.parametrize("limit", [0, 1, 2, 3, 10, 1023, 1024, 1025, 5000])
+def test_primes_up_to_matches_naive(fresh_sieve, limit):
+    assert qs.primes_up_to(limit).tolist() == naive_primes(limit)
+
+
+def test_primes_up_to_slices_after_growth(fresh_sieve):
+    qs.primes_up_to(5000)
+    assert qs.primes_up_to(10).tolist() == [2, 3, 5, 7]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3])
+def test_smallest_factor_of_tiny_numbers(fresh_sieve, n):
+    assert qs.smallest_factor(n) is None
+
+
+@pytest.mark.parametrize("p", [2, 3, 5, 31, 1021, 1031])
+def test_smallest_factor_of_prime_squares(fresh_sieve, p):
+    assert qs.smallest_factor(p * p) == p
+
+
+@pytest.mark.parametrize("n", [
+    1021 * 1031,   # factors straddle the initial 1024 sieve bound
+    1019 * 1021,   # both just below it
+    1031 * 1033,   # both just above it
+    2039 * 2053,   # straddle the doubled 2048 bound
+    3163 * 3167,   # near the 10^7 demo cutoff
+])
+def test_smallest_factor_of_semiprimes_near_sieve_bound(fresh_sieve, n):
+    assert qs.smallest_factor(n) == naive_smallest_factor(n)
+
+
+@pytest.mark.parametrize("p", [1021, 1031, 9999991])
+def test_smallest_factor_of_primes(fresh_sieve, p):
+    assert qs.smallest_factor(p) is None
+
+
+@pytest.mark.parametrize("round_", range(10))
+def test_smallest_factor_while_other_threads_grow_the_sieve(fresh_sieve, round_):
+    # Every thread starts from the empty sieve at once and asks for a different bound,
+    # so the table is grown concurrently to several sizes while others read it
+    primes = naive_primes(40000)
+    semiprimes = [p * q for p, q in zip(primes[100::150], primes[101::150])]
+    expected = {n: naive_smallest_factor(n) for n in semiprimes}
+    start = threading.Barrier(len(semiprimes))
+    wrong = []
+
+    def worker(first):
+        start.wait()
+        for n in [first] + semiprimes:
+            if qs.smallest_factor(n) != expected[n]:
+                wrong.append(n)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in semiprimes]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert wrong == []
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 15, 3233, 2 ** 64 + 13, 2 ** 2048 - 1])
+def test_factoring_complexity_matches_direct_formula(n):
+    ln_n = math.log(max(n, 2))
+    expected_classical = math.exp((64 / 9 * ln_n) ** (1 / 3) * math.log(max(ln_n, 1)) ** (2 / 3))
+    expected_quantum = math.log2(max(n, 2)) ** 3
+    classical, quantum = qs.factoring_complexity(n)
+    assert classical == pytest.approx(expected_classical, rel=1e-9)
+    assert quantum == pytest.approx(expected_quantum, rel=1e-12)
@@ -0,0 +1,70 @@
+"""Tests for request-body validation on the simulation endpoints."""
+
+import pytest
+
+import quantum_service as qs
+
+
+@pytest.fixture
+def client():
+    return qs.app.test_client()
+
+
+@pytest.mark.parametrize("endpoint", ['/api/quantum/shor', '/api/quantum/grover'])
+@pytest.mark.parametrize("precision", [["x"], {"bits": 64}, 64, None, "quad"])
+def test_unsupported_precision_is_rejected(client, endpoint, precision):
+    response = client.post(endpoint, json={"modulus": 15, "key_bits": 8, "precision": precision})
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["error"].startswith("Unsupported precision")
+    assert "single" in body["supported_precisions"]
+
+
+@pytest.mark.parametrize("alias, canonical", [("fp32", "single"), ("fp64", "double"), ("FP64", "double")])
+def test_precision_aliases_are_accepted(client, alias, canonical):
+    response = client.post('/api/quantum/grover', json={"key_bits": 6, "seed": 1, "precision": alias})
+    assert response.status_code == 200
+    assert response.get_json()["result"]["precision"] == canonical
+
+
+@pytest.fixture
+def qft_flags(monkeypatch):
+    """Record the simulate_qft value each ShorsAlgorithm is built with, then skip the QFT.
+
+    Only the parsed flag matters here; the RSA attack's register takes seconds to simulate.
+    """
+    seen = []
+    original_init = qs.ShorsAlgorithm.__init__
+
+    def spy(self, *args, **kwargs):
+        seen.append(kwargs.pop("simulate_qft"))
+        original_init(self, *args, simulate_qft=False, **kwargs)
+
+    monkeypatch.setattr(qs.ShorsAlgorithm, "__init__", spy)
+    return seen
+
+
+@pytest.mark.parametrize("endpoint", ['/api/quantum/shor', '/api/quantum/attack/rsa'])
+@pytest.mark.parametrize("flag, expected", [
+    (False, False), ("false", False), ("False", False), ("0", False), (0, False), ("off", False),
+    (True, True), ("true", True), ("1", True), (1, True),
+])
+def test_simulate_qft_flag_is_parsed(client, qft_flags, endpoint, flag, expected):
+    response = client.post(endpoint, json={"modulus": 15, "key_bits": 8, "simulate_qft": flag, "verbose": False})
+    assert response.status_code == 200
+    assert qft_flags == [expected]
+
+
+@pytest.mark.parametrize("endpoint", ['/api/quantum/shor', '/api/quantum/attack/rsa'])
+@pytest.mark.parametrize("flag", ["maybe", 2, ["false"], None])
+def test_non_boolean_simulate_qft_is_rejected(client, qft_flags, endpoint, flag):
+    response = client.post(endpoint, json={"modulus": 15, "simulate_qft": flag})
+    assert response.status_code == 400
+    assert "simulate_qft" in response.get_json()["error"]
+    assert qft_flags == []
+
+
+def test_simulate_qft_query_parameter(client, qft_flags):
+    response = client.post('/api/quantum/shor?simulate_qft=false', json={"modulus": 15, "verbose": False})
+    assert response.status_code == 200
+    assert qft_flags == [False]
@@ -0,0 +1,50 @@
+"""Tests for the classical pieces of Shor's algorithm."""
+
+import math
+
+import pytest
+
+import quantum_service as qs
+
+
+def naive_order(a, n):
+    """Smallest r >= 1 with a^r = 1 (mod n), by repeated multiplication."""
+    value, r = a % n, 1
+    while value != 1:
+        value = (value * a) % n
+        r += 1
+    return r
+
+
+@pytest.fixture(scope="module")
+def shor():
+    return qs.ShorsAlgorithm(verbose=False, seed=0)
+
+
+@pytest.mark.parametrize("n", [15, 21, 35, 91])
+def test_find_period_matches_naive_order(shor, n):
+    limit = 1 << (2 * n.bit_length() + 1)
+    for a in range(2, n):
+        if math.gcd(a, n) != 1:
+            continue
+        r, _ = shor._find_period(a, n, limit)
+        assert r == naive_order(a, n), (a, n)
+
+
+@pytest.mark.parametrize("a, n", [(2, 91), (3, 35), (2, 15), (5, 21)])
+def test_find_period_returns_limit_when_order_exceeds_it(shor, a, n):
+    order = naive_order(a, n)
+    for limit in range(1, order):
+        assert shor._find_period(a, n, limit)[0] == limit
+
+
+def test_find_period_at_exact_limit(shor):
+    order = naive_order(2, 91)
+    assert shor._find_period(2, 91, order)[0] == order
+
+
+def test_factor_small_semiprimes():
+    for n, factors in [(15, {3, 5}), (21, {3, 7}), (35, {5, 7}), (91, {7, 13})]:
+        result = qs.ShorsAlgorithm(verbose=False, seed=1).factor(n, 8)
+        assert result.success
+        assert {result.factor_p, result.factor_q} == factors
@@ -0,0 +1,70 @@
+"""Tests for the /api/quantum/status capability report."""
+
+import quantum_service as qs
+
+
+def test_max_qubits_never_exceeds_algorithm_caps():
+    capabilities = qs.app.test_client().get('/api/quantum/status').get_json()["capabilities"]
+    assert capabilities["shor_max_qubits"] <= qs.SHOR_MAX_QUBITS
+    assert capabilities["grover_max_qubits"] <= qs.GROVER_MAX_QUBITS
+    assert capabilities["max_qubits"] == max(capabilities["shor_max_qubits"],
+                                             capabilities["grover_max_qubits"])
+
+
+def test_memory_bound_still_applies(monkeypatch):
+    monkeypatch.setattr(qs, "max_state_qubits", lambda itemsize: 12)
+    capabilities = qs.app.test_client().get('/api/quantum/status').get_json()["capabilities"]
+    assert capabilities["max_qubits"] == 12
+    assert capabilities["grover_max_qubits"] == 12
+
+
+def test_status_answers_200_while_gpu_initializes(monkeypatch):
+    started = []
+    monkeypatch.setattr(qs, "GPU_INIT_DONE", False)
+    monkeypatch.setattr(qs, "start_gpu_initialization", lambda: started.append(True))
+    response = qs.app.test_client().get('/api/quantum/status')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["status"] == "initializing"
+    assert body["gpu_operational"] is False
+    assert started == [True]
+
+
+def test_background_initialization_starts_once(monkeypatch):
+    release = qs.threading.Event()
+    calls = []
+
+    def slow_init():
+        calls.append(True)
+        release.wait(5)
+
+    monkeypatch.setattr(qs, "GPU_INIT_DONE", False)
+    monkeypatch.setattr(qs, "_gpu_init_thread", None)
+    monkeypatch.setattr(qs, "ensure_gpu_initialized", slow_init)
+    qs.start_gpu_initialization()
+    qs.start_gpu_initialization()
+    thread = qs._gpu_init_thread
+    release.set()
+    thread.join(5)
+    assert calls == [True]
+
+
+def test_status_reports_ready_after_initialization():
+    client = qs.app.test_client()
+    qs.ensure_gpu_initialized()
+    assert client.get('/api/quantum/status').get_json()["status"] == "ready"
+
+
+def test_host_memory_reads_mem_available(tmp_path, monkeypatch):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16384000 kB\n"
+                       "MemFree:          512000 kB\n"
+                       "MemAvailable:   12288000 kB\n"
+                       "Cached:         11000000 kB\n")
+    monkeypatch.setattr(qs, "MEMINFO_PATH", str(meminfo))
+    assert qs.available_host_memory() == 12288000 * 1024
+
+
+def test_host_memory_falls_back_without_meminfo(tmp_path, monkeypatch):
+    monkeypatch.setattr(qs, "MEMINFO_PATH", str(tmp_path / "missing"))
+    assert qs.available_host_memory() == qs.os.sysconf('SC_AVPHYS_PAGES') * qs.os.sysconf('SC_PAGE_SIZE')